@@ -0,0 +1,471 @@
+"""
+Benchmarks the data processing of GaelForce without Google Sheets.
+
+A seeded generator builds master data shaped like the M2 buoy worksheet,
+with missing values, duplicate rows, malformed timestamps and outliers
+injected at set rates. The data is run through validate_master_data,
+format_df_date, filter_data_by_date, format_df_data_for_display and the
+chart payload building of user_requested_graph, with every worksheet
+held in memory, and the time, throughput and peak memory of each
+function are reported.
+
+Usage:
+    python benchmark.py                     # 32k and 1M rows
+    python benchmark.py --sizes 32k,1m,10m  # 10M rows needs ~16GB of RAM
+"""
+import io
+import os
+import json
+import time
+import argparse
+import contextlib
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+import run
+
+
+# Dataset sizes that can be given by name on the command line
+SIZES = {'32k': 32_000, '1m': 1_000_000, '10m': 10_000_000}
+
+# Columns of the M2 master data worksheet. The station and position
+# columns are dropped by ingest_master_data, as in the live sheet.
+M2_COLUMNS = [
+    'station_id', 'longitude', 'latitude'
+    ] + list(run.MASTER_DATA_SCHEMA)
+
+# Rates at which each kind of bad data is injected, per row
+DEFAULT_RATES = {
+    'missing': 0.002,
+    'duplicates': 0.001,
+    'malformed': 0.001,
+    'outliers': 0.0005
+    }
+
+# Timestamps in the formats found in hand edited rows of the master data
+MALFORMED_TIME_FORMATS = [
+    '%d/%m/%Y %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M', '%d-%m-%Y'
+    ]
+
+
+class MemoryWorksheet(run.LocalWorksheet):
+    """
+    A worksheet held in memory.
+
+    Implements the same part of the gspread Worksheet interface as
+    LocalWorksheet, which it extends, so the app writes to it through
+    LocalBackend the same way it writes to local storage, but keeps its
+    rows in a list so the benchmarks time the app rather than SQLite.
+    """
+
+    def __init__(self, title, sheet_id, rows=None):
+        self.title = title
+        self.id = sheet_id
+        self.rows = rows if rows is not None else []
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    @property
+    def col_count(self):
+        return max((len(row) for row in self.rows), default=0)
+
+    def get_all_values(self):
+        """
+        Returns every row in the worksheet as a list of lists of strings.
+        """
+        return self.rows
+
+    def row_values(self, row):
+        """
+        Returns the values in a single row, numbered from 1.
+        """
+        return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def get_values(self, range_name):
+        """
+        Returns the values in an A1 range such as 'A5:K' or 'A5:K9'.
+        """
+        grid = run.gspread.utils.a1_range_to_grid_range(range_name)
+        start_row = grid.get('startRowIndex', 0)
+        end_row = grid.get('endRowIndex', len(self.rows))
+        start_col = grid.get('startColumnIndex', 0)
+        end_col = grid.get('endColumnIndex')
+        return [
+            row[start_col:end_col] for row in self.rows[start_row:end_row]
+            ]
+
+    def update(self, values, range_name='A1'):
+        """
+        Writes a list of lists of values starting at the given cell.
+        """
+        start_row, start_col = run.gspread.utils.a1_to_rowcol(range_name)
+        if start_row == 1 and start_col == 1 and not self.rows:
+            self.rows = [list(row) for row in values]
+            return
+        for offset, new_values in enumerate(values):
+            row = start_row - 1 + offset
+            while len(self.rows) <= row:
+                self.rows.append([])
+            cells = self.rows[row]
+            cells += [''] * (start_col - 1 + len(new_values) - len(cells))
+            for col, value in enumerate(new_values, start=start_col - 1):
+                cells[col] = '' if value is None else str(value)
+
+    def clear(self):
+        """
+        Removes every row from the worksheet.
+        """
+        self.rows = []
+
+
+def generate_master_data(rows, seed=2024, rates=None):
+    """
+    Generates master data shaped like the M2 buoy worksheet.
+
+    The measurements follow the daily and seasonal cycles and the usual
+    ranges of the buoy, and are written as text with one decimal place,
+    as get_all_values returns them. Readings are hourly, as from the buoy,
+    unless that would run the times past the year 2200, when they are a
+    minute apart instead.
+
+    Args:
+    - rows (int): The number of data rows, not counting the header.
+    - seed (int): The seed of the random generator, so every run with the
+      same arguments gives the same data.
+    - rates (dict, optional): The share of rows with a missing value, a
+      duplicate row, a malformed timestamp and an outlier, keyed as in
+      DEFAULT_RATES. Defaults to DEFAULT_RATES.
+
+    Returns:
+    - list: The master data as a list of lists of strings, the first row
+      holding the column headers.
+    """
+    rates = {**DEFAULT_RATES, **(rates or {})}
+    rng = np.random.default_rng(seed)
+
+    step = 'h' if rows < 1_500_000 else 'min'
+    times = pd.date_range('2001-06-01', periods=rows, freq=step)
+    hours = np.arange(rows) * (1.0 if step == 'h' else 1 / 60)
+    daily = np.sin(2 * np.pi * hours / 24)
+    seasonal = np.sin(2 * np.pi * hours / 8766)
+
+    wind_speed = rng.gamma(3.0, 4.5, rows)
+    wave_height = rng.lognormal(0.3, 0.5, rows)
+    measurements = {
+        'AtmosphericPressure': 1013 + 8 * seasonal + rng.normal(0, 9, rows),
+        'WindDirection': rng.uniform(0, 360, rows),
+        'WindSpeed': wind_speed,
+        'Gust': wind_speed * rng.uniform(1.1, 1.6, rows),
+        'WaveHeight': wave_height,
+        'WavePeriod': 3 + 2 * wave_height + rng.normal(0, 0.7, rows),
+        'MeanWaveDirection': rng.uniform(0, 360, rows),
+        'AirTemperature': (
+            11 + 4 * seasonal + daily + rng.normal(0, 1.2, rows)
+            ),
+        'SeaTemperature': 11.5 + 3 * seasonal + rng.normal(0, 0.4, rows),
+        'RelativeHumidity': np.clip(
+            84 + rng.normal(0, 7, rows), 40, 100
+            )
+        }
+
+    # Push some readings far outside the range of their column
+    outlier_rows = rng.random(rows) < rates['outliers']
+    for values in measurements.values():
+        picked = outlier_rows & (rng.random(rows) < 0.3)
+        values[picked] = (
+            values.mean() + rng.choice([-1, 1], picked.sum())
+            * rng.uniform(6, 10, picked.sum()) * values.std()
+            )
+
+    columns = {
+        'station_id': np.full(rows, 'M2', dtype=object),
+        'longitude': np.full(rows, '-5.425', dtype=object),
+        'latitude': np.full(rows, '53.48', dtype=object),
+        'time': np.char.add(
+            np.datetime_as_string(times.values, unit='s'), 'Z'
+            ).astype(object)
+        }
+    for column, values in measurements.items():
+        columns[column] = np.char.mod('%.1f', values).astype(object)
+
+    # Write some timestamps in other formats
+    for position in np.flatnonzero(rng.random(rows) < rates['malformed']):
+        time_format = MALFORMED_TIME_FORMATS[
+            rng.integers(len(MALFORMED_TIME_FORMATS))
+            ]
+        columns['time'][position] = times[position].strftime(time_format)
+
+    # Blank a random measurement in some rows
+    missing_rows = np.flatnonzero(rng.random(rows) < rates['missing'])
+    missing_columns = rng.integers(
+        len(run.MEASUREMENT_COLUMNS), size=len(missing_rows)
+        )
+    for position, column in zip(missing_rows, missing_columns):
+        columns[run.MEASUREMENT_COLUMNS[column]][position] = ''
+
+    data = np.column_stack([columns[column] for column in M2_COLUMNS])
+
+    # Repeat some rows straight after themselves, as a double import does
+    repeated = np.flatnonzero(rng.random(rows - 1) < rates['duplicates'])
+    data[repeated + 1] = data[repeated]
+
+    return [M2_COLUMNS] + data.tolist()
+
+
+def new_worksheets(master_data):
+    """
+    Returns in memory worksheets for every worksheet used by the app, the
+    master data worksheet holding master_data.
+    """
+    titles = [
+        'marine_data_master_data_2020_2024', 'validated_master_data',
+        'user_data_output', 'session_log', 'gael_force_error_log',
+        'date_time_error_log', 'graphical_output_data', 'atmos_outliers',
+        'wind_outliers', 'wave_outliers', 'temp_outliers'
+        ]
+    worksheets = {
+        title: MemoryWorksheet(title, sheet_id)
+        for sheet_id, title in enumerate(titles)
+        }
+    worksheets['marine_data_master_data_2020_2024'].rows = master_data
+    return worksheets
+
+
+def measure(function, trace_memory):
+    """
+    Runs a function with its printed output hidden, and times it.
+
+    Args:
+    - function (function): The function to run, taking no arguments.
+    - trace_memory (bool): Whether to trace the peak memory allocated
+      while it runs. Tracing slows the function down, so the memory and
+      the time are measured in separate runs.
+
+    Returns:
+    - tuple: The result of the function, the wall time in seconds and
+      the peak memory in MB, or None if memory was not traced.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = function()
+        wall_time = time.perf_counter() - start
+        peak_memory = None
+        if trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result, wall_time, peak_memory
+
+
+def benchmark_functions(master_data, trace_memory):
+    """
+    Runs each benchmarked function once on the master data, each on the
+    output of the one before, as in a session.
+
+    Args:
+    - master_data (list): The master data returned by
+      generate_master_data.
+    - trace_memory (bool): Whether to trace the peak memory of each
+      function rather than time it alone.
+
+    Returns:
+    - list: For each function, its name, the rows given to it, the wall
+      time in seconds and the peak memory in MB or None.
+    """
+    worksheets = new_worksheets(master_data)
+    results = []
+
+    # The worksheet writes run in the background, and are waited for so
+    # the time is comparable with a validation that wrote them in line
+    def validate():
+        validated = run.validate_master_data(
+            run.LocalBackend(), master_data, [], [],
+            worksheets['session_log'],
+            worksheets['gael_force_error_log'],
+            worksheets['date_time_error_log'],
+            worksheets['validated_master_data'], '',
+            worksheets['atmos_outliers'], '',
+            worksheets['wind_outliers'], '',
+            worksheets['wave_outliers'], '',
+            worksheets['temp_outliers'], '', ''
+            )[0]
+        run.SHEET_WRITER.wait()
+        return validated
+
+    validated_df, wall_time, peak_memory = measure(validate, trace_memory)
+    results.append([
+        'validate_master_data', len(master_data) - 1, wall_time, peak_memory
+        ])
+
+    rows = len(validated_df)
+    validated_df, wall_time, peak_memory = measure(
+        lambda: run.format_df_date(validated_df), trace_memory
+        )
+    results.append(['format_df_date', rows, wall_time, peak_memory])
+
+    # Ask for the middle half of the data, as a user picking a long range
+    start_date = validated_df.index[len(validated_df) // 4]
+    end_date = validated_df.index[3 * len(validated_df) // 4]
+    rows = len(validated_df)
+    date_filtered_df, wall_time, peak_memory = measure(
+        lambda: run.filter_data_by_date(
+            validated_df, start_date.strftime('%d-%m-%Y'),
+            end_date.strftime('%d-%m-%Y')
+            ),
+        trace_memory
+        )
+    results.append(['filter_data_by_date', rows, wall_time, peak_memory])
+
+    rows = len(date_filtered_df)
+    working_data_df, wall_time, peak_memory = measure(
+        lambda: run.format_df_data_for_display(date_filtered_df),
+        trace_memory
+        )
+    results.append([
+        'format_df_data_for_display', rows, wall_time, peak_memory
+        ])
+
+    # Local worksheets have no charts, so only the chart data is built
+    # and written
+    y_cols = ['WindSpeed', 'Gust', 'WaveHeight']
+    _, wall_time, peak_memory = measure(
+        lambda: run.user_requested_graph(
+            working_data_df[['time'] + y_cols], 'time', y_cols,
+            'Benchmark', run.LocalBackend(), '',
+            worksheets['graphical_output_data']
+            ),
+        trace_memory
+        )
+    results.append([
+        'user_requested_graph', len(working_data_df), wall_time, peak_memory
+        ])
+
+    return results
+
+
+def run_benchmarks(sizes, seed, repeat, trace_memory):
+    """
+    Benchmarks each function at each dataset size.
+
+    The time of each function is the fastest of repeat runs. The peak
+    memory is measured in one more run with tracing turned on.
+
+    Args:
+    - sizes (list of int): The numbers of master data rows.
+    - seed (int): The seed of the data generator.
+    - repeat (int): The number of timed runs at each size.
+    - trace_memory (bool): Whether to measure the peak memory.
+
+    Returns:
+    - pd.DataFrame: One row per size and function, with the rows, the
+      time, the throughput and the peak memory.
+    """
+    records = []
+    for size in sizes:
+        print(f"Generating {size} rows of master data")
+        master_data = generate_master_data(size, seed)
+
+        runs = []
+        for attempt in range(repeat):
+            print(f"    Timing run {attempt + 1} of {repeat}")
+            runs.append(benchmark_functions(master_data, False))
+        memory = None
+        if trace_memory:
+            print("    Memory run")
+            memory = benchmark_functions(master_data, True)
+
+        for position, (function, rows, _, _) in enumerate(runs[0]):
+            wall_time = min(timings[position][2] for timings in runs)
+            records.append({
+                'size': size,
+                'function': function,
+                'rows': rows,
+                'seconds': wall_time,
+                'rows_per_second': rows / wall_time if wall_time else None,
+                'peak_mb': memory[position][3] if memory else np.nan
+                })
+        del master_data
+
+    return pd.DataFrame(records)
+
+
+def parse_size(size):
+    """
+    Returns the number of rows for a size given as a name in SIZES or
+    as a number.
+    """
+    size = size.strip().lower()
+    return SIZES[size] if size in SIZES else int(size)
+
+
+def main():
+    """
+    Runs the benchmarks given on the command line and prints the report.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark GaelForce on synthetic M2 master data."
+        )
+    parser.add_argument(
+        '--sizes', default='32k,1m',
+        help="dataset sizes separated by commas, as 32k, 1m, 10m or a "
+             "number of rows (default: 32k,1m)"
+        )
+    parser.add_argument(
+        '--seed', type=int, default=2024,
+        help="seed of the data generator (default: 2024)"
+        )
+    parser.add_argument(
+        '--repeat', type=int, default=1,
+        help="timed runs at each size, the fastest is reported "
+             "(default: 1)"
+        )
+    parser.add_argument(
+        '--no-memory', action='store_true',
+        help="skip the run that measures peak memory"
+        )
+    parser.add_argument(
+        '--json', metavar='PATH',
+        help="also write the results to a JSON file"
+        )
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(',')]
+    results = run_benchmarks(
+        sizes, args.seed, max(args.repeat, 1), not args.no_memory
+        )
+
+    print("\n")
+    print("#############################################################")
+    print(">>>>>   Benchmark Results                               <<<<<")
+    print("#############################################################")
+    print("\n")
+    print(results.to_string(
+        index=False, na_rep='-',
+        formatters={
+            'seconds': '{:.3f}'.format,
+            'rows_per_second': '{:,.0f}'.format,
+            'peak_mb': '{:.1f}'.format
+            }
+        ))
+    print("\n")
+
+    if args.json:
+        json_dir = os.path.dirname(args.json)
+        if json_dir:
+            os.makedirs(json_dir, exist_ok=True)
+        with open(args.json, 'w') as json_file:
+            records = results.astype(object).where(results.notna(), None)
+            json.dump(
+                records.to_dict(orient='records'), json_file, indent=2
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,61 @@
 const Pty = require('node-pty');
 const fs = require('fs');
+const net = require('net');
+const { spawn } = require('child_process');
+
+// Unix socket of the Python session server, which validates the data once
+// and runs each terminal session in a worker forked from it
+const SESSION_SOCKET = process.env.GAELFORCE_SOCKET || '/tmp/gaelforce.sock';
 
 exports.install = function () {
 
     ROUTE('/');
     WEBSOCKET('/', socket, ['raw']);
 
+    startSessionServer();
+
 };
 
+function startSessionServer() {
+
+    var server = spawn('python3', ['run.py', '--serve', SESSION_SOCKET], {
+        cwd: process.env.PWD,
+        env: process.env,
+        stdio: 'inherit'
+    });
+
+    // Restart the server if it stops, sessions spawn their own process
+    // until it is back
+    server.on('exit', function (code, signal) {
+        console.log("Session server exited, restarting");
+        setTimeout(startSessionServer, 5000);
+    });
+
+}
+
+function spawnTerminal(client) {
+
+    // Spawn terminal
+    client.tty = Pty.spawn('python3', ['run.py'], {
+        name: 'xterm-color',
+        cols: 80,
+        rows: 24,
+        cwd: process.env.PWD,
+        env: process.env
+    });
+
+    client.tty.on('exit', function (code, signal) {
+        client.tty = null;
+        client.close();
+        console.log("Process killed");
+    });
+
+    client.tty.on('data', function (data) {
+        client.send(data);
+    });
+
+}
+
 function socket() {
 
     this.encodedecode = false;
@@ -15,28 +63,44 @@ function socket() {
 
     this.on('open', function (client) {
 
-        // Spawn terminal
-        client.tty = Pty.spawn('python3', ['run.py'], {
-            name: 'xterm-color',
-            cols: 80,
-            rows: 24,
-            cwd: process.env.PWD,
-            env: process.env
+        // Connect to a waiting session worker, or spawn a terminal if the
+        // session server is not running
+        var session = net.createConnection(SESSION_SOCKET);
+        var connected = false;
+        client.session = session;
+        session.setEncoding('utf8');
+
+        session.on('connect', function () {
+            connected = true;
         });
 
-        client.tty.on('exit', function (code, signal) {
-            client.tty = null;
-            client.close();
-            console.log("Process killed");
+        session.on('error', function (err) {
+            if (!connected && client.session === session) {
+                client.session = null;
+                spawnTerminal(client);
+            }
+        });
+
+        session.on('close', function () {
+            if (connected && client.session === session) {
+                client.session = null;
+                client.close();
+                console.log("Session ended");
+            }
         });
 
-        client.tty.on('data', function (data) {
+        session.on('data', function (data) {
             client.send(data);
         });
 
     });
 
     this.on('close', function (client) {
+        if (client.session) {
+            client.session.destroy();
+            client.session = null;
+            console.log("Session closed");
+        }
         if (client.tty) {
             client.tty.kill(9);
             client.tty = null;
@@ -45,7 +109,11 @@ function socket() {
     });
 
     this.on('message', function (client, msg) {
-        client.tty && client.tty.write(msg);
+        if (client.session) {
+            client.session.write(msg);
+        } else if (client.tty) {
+            client.tty.write(msg);
+        }
     });
 }
 
@@ -57,4 +125,4 @@ if (process.env.CREDS != null) {
             socket.emit("console_output", "Error saving credentials: " + err);
         }
     });
-}
\ No newline at end of file
+}
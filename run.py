@@ -1,13 +1,465 @@
-import gspread
-import pandas as pd
-import numpy as np
-from google.oauth2.service_account import Credentials
-from oauth2client.service_account import ServiceAccountCredentials
-from gspread_dataframe import set_with_dataframe
-from scipy.stats import zscore
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from google.auth.exceptions import GoogleAuthError
+import time
+import os
+import re
+import sys
+import gc
+import csv
+import json
+import sqlite3
+import atexit
+import argparse
+import cProfile
+import contextlib
+import fcntl
+import importlib
+import select
+import signal
+import socket
+import struct
+import termios
+import hashlib
+import threading
+import tracemalloc
+import urllib.parse
+
+# Time the module started loading, for the import report
+MODULE_LOAD_START = time.perf_counter()
+
+# Time taken by each module imported on first use, with the function
+# that first used it
+IMPORT_TIMES = []
+
+
+class LazyModule:
+    """
+    A module that is only imported when one of its attributes is first
+    used.
+
+    The heavy libraries are loaded this way, so a session is not kept
+    waiting at its first prompt on modules it may never need. On first
+    use the module is imported, the time taken is added to IMPORT_TIMES,
+    and the global name bound to the lazy module is replaced with the
+    module itself, so later uses cost nothing extra.
+    """
+
+    def __init__(self, name, alias):
+        self.__dict__['name'] = name
+        self.__dict__['alias'] = alias
+
+    def load(self, first_use=None):
+        """
+        Imports the module and binds its global name to it.
+
+        Args:
+        - first_use (str, optional): The name of the function using the
+          module, for the import report.
+        """
+        start = time.perf_counter()
+        module = importlib.import_module(self.name)
+        if globals().get(self.alias) is self:
+            IMPORT_TIMES.append({
+                'module': self.name,
+                'seconds': time.perf_counter() - start,
+                'first_use': first_use
+                })
+            globals()[self.alias] = module
+        return module
+
+    def __getattr__(self, attribute):
+        return getattr(
+            self.load(sys._getframe(1).f_code.co_name), attribute
+            )
+
+
+# Libraries imported on first use
+pd = LazyModule('pandas', 'pd')
+np = LazyModule('numpy', 'np')
+gspread = LazyModule('gspread', 'gspread')
+gspread_dataframe = LazyModule('gspread_dataframe', 'gspread_dataframe')
+httplib2 = LazyModule('httplib2', 'httplib2')
+requests_adapters = LazyModule('requests.adapters', 'requests_adapters')
+service_account = LazyModule(
+    'google.oauth2.service_account', 'service_account'
+    )
+google_requests = LazyModule(
+    'google.auth.transport.requests', 'google_requests'
+    )
+google_auth_httplib2 = LazyModule(
+    'google_auth_httplib2', 'google_auth_httplib2'
+    )
+google_auth_exceptions = LazyModule(
+    'google.auth.exceptions', 'google_auth_exceptions'
+    )
+discovery = LazyModule('googleapiclient.discovery', 'discovery')
+googleapiclient_errors = LazyModule(
+    'googleapiclient.errors', 'googleapiclient_errors'
+    )
+scipy_stats = LazyModule('scipy.stats', 'scipy_stats')
+futures = LazyModule('concurrent.futures', 'futures')
+
+
+def preload_modules():
+    """
+    Imports every library that is imported on first use, for a process
+    that forks sessions and wants them to share the loaded modules.
+    """
+    for name, value in list(globals().items()):
+        if isinstance(value, LazyModule):
+            value.load('preload_modules')
+
+
+# Local snapshot of the raw and validated master data. The next session
+# reads only the rows appended since, and validates only those rows.
+# Increase the version when the format of the validated data changes.
+SNAPSHOT_DIR = '.cache'
+SNAPSHOT_FILE = os.path.join(SNAPSHOT_DIR, 'master_data_snapshot.pkl')
+SNAPSHOT_VERSION = 7
+
+# Hours between full reads of the master data worksheet, which check
+# every row for edits. In between, only the rows appended since the
+# snapshot are read. Set to 0 to read the whole worksheet every session.
+FULL_CHECK_HOURS = float(os.environ.get('GAELFORCE_FULL_CHECK_HOURS', 24))
+
+# IDs of the charts drawn on the chart data worksheet, so the next chart
+# can update the existing one in place
+CHART_STATE_FILE = os.path.join(SNAPSHOT_DIR, 'chart_ids.json')
+
+# Types of the master data columns used in the application. The time
+# column stays as text until its format has been validated.
+MASTER_DATA_SCHEMA = {
+    'time': 'object',
+    'AtmosphericPressure': 'float64',
+    'WindDirection': 'float64',
+    'WindSpeed': 'float64',
+    'Gust': 'float64',
+    'WaveHeight': 'float64',
+    'WavePeriod': 'float64',
+    'MeanWaveDirection': 'float64',
+    'AirTemperature': 'float64',
+    'SeaTemperature': 'float64',
+    'RelativeHumidity': 'float64'
+    }
+MEASUREMENT_COLUMNS = [
+    column for column, dtype in MASTER_DATA_SCHEMA.items()
+    if dtype != 'object'
+    ]
+
+# Format of the time column in the data shown to the user
+DISPLAY_TIME_FORMAT = '%d-%m-%Y %H:%M:%S'
+
+# Columns in each data selection offered to the user, keyed by the name
+# of the selection on the command line
+COLUMN_GROUPS = {
+    'all': ['time'] + MEASUREMENT_COLUMNS,
+    'atmospheric': ['time', 'AtmosphericPressure'],
+    'wind': ['time', 'WindSpeed', 'Gust'],
+    'wave': ['time', 'WaveHeight', 'WavePeriod', 'MeanWaveDirection'],
+    'temperature': ['time', 'AirTemperature', 'SeaTemperature']
+    }
+
+# Storage backend, either 'sheets' for Google Sheets or 'local' for a
+# SQLite file that holds the same worksheets
+STORAGE_BACKEND = os.environ.get('GAELFORCE_STORAGE', 'sheets')
+LOCAL_DB_FILE = os.environ.get('GAELFORCE_DB', 'gaelforce.db')
+LOCAL_MASTER_DATA_CSV = os.environ.get(
+    'GAELFORCE_MASTER_CSV', 'marine_data_master_data_2020_2024.csv'
+    )
+
+# Scopes needed to read and write the Google Sheet
+SCOPE = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive.file",
+    "https://www.googleapis.com/auth/drive"
+    ]
+
+# Validation stages run on the master data, in order. Stages can be
+# reordered or left out per deployment with GAELFORCE_VALIDATION_STAGES.
+VALIDATION_STAGE_ORDER = os.environ.get(
+    'GAELFORCE_VALIDATION_STAGES',
+    'missing_values,duplicates,outliers,date_format'
+    ).split(',')
+
+# Stages that cannot be left out. The date format stage also converts the
+# time column to the format the rest of the app reads it in.
+REQUIRED_VALIDATION_STAGES = ['date_format']
+
+# Measure the peak memory of each validation stage. Tracing memory
+# slows validation down several times, so it is off unless asked for.
+TRACE_STAGE_MEMORY = os.environ.get('GAELFORCE_STAGE_MEMORY') == '1'
+
+# Number of standard deviations from the mean beyond which a measurement
+# is an outlier
+OUTLIER_THRESHOLD = 3
+
+# Number of hourly rows in the rolling window used to score outliers.
+# When unset, each measurement is scored against all the data.
+OUTLIER_WINDOW = int(os.environ.get('GAELFORCE_OUTLIER_WINDOW', 0)) or None
+
+# Most points plotted for each series in a chart. Longer series are
+# downsampled to this many points, keeping the shape of the line.
+CHART_POINT_BUDGET = int(os.environ.get('GAELFORCE_CHART_POINTS', 1000))
+
+# Longest time, in seconds, a buffered log entry waits before it is
+# written to its log worksheet
+LOG_FLUSH_INTERVAL = 5
+
+
+class SessionProfiler:
+    """
+    Records where the time of a session goes, when profiling is turned
+    on with --profile.
+
+    The wall and CPU time of each phase of the session are recorded, as
+    is the wall time of every Google API request. Phases can be nested,
+    and each records its own total. A report is printed when the
+    application exits, and with --profile-stats a cProfile dump and a
+    JSON copy of the timings are written too.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = []
+        self.api_calls = []
+        self.stats_path = None
+        self.profile = None
+
+    def start(self, stats_path=None):
+        """
+        Turns profiling on for the rest of the session.
+
+        Args:
+        - stats_path (str, optional): The path of the cProfile dump. The
+          timings are written next to it with a .json extension.
+          Defaults to None, which writes no files.
+        """
+        self.enabled = True
+        self.stats_path = stats_path
+        if stats_path:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        atexit.register(self.finish)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Times the code run inside the with block as the named phase.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'phase': name,
+                'wall_time': time.perf_counter() - wall_start,
+                'cpu_time': time.process_time() - cpu_start
+                })
+
+    def timed_request(self, request, method_position=0, url_position=1):
+        """
+        Wraps the request function of an HTTP client so the wall time of
+        each Google API request is recorded.
+
+        Args:
+        - request (function): The request function, taking the method
+          and URL as arguments.
+        - method_position, url_position (int): The positions of the
+          method and URL arguments.
+
+        Returns:
+        - function: The wrapped request function.
+        """
+        def timed(*args, **kwargs):
+            method = kwargs.get('method', 'GET')
+            url = kwargs.get('url', kwargs.get('uri', ''))
+            if len(args) > method_position:
+                method = args[method_position]
+            if len(args) > url_position:
+                url = args[url_position]
+            start = time.perf_counter()
+            try:
+                return request(*args, **kwargs)
+            finally:
+                self.api_calls.append({
+                    'call': api_call_name(method, url),
+                    'wall_time': time.perf_counter() - start
+                    })
+
+        return timed
+
+    def summarise_api_calls(self):
+        """
+        Returns the API call timings totalled by call.
+        """
+        if not self.api_calls:
+            return pd.DataFrame(
+                columns=['call', 'count', 'total', 'mean', 'max']
+                )
+
+        calls = pd.DataFrame(self.api_calls)
+        summary = calls.groupby('call')['wall_time'].agg(
+            ['count', 'sum', 'mean', 'max']
+            ).rename(columns={'sum': 'total'})
+        return summary.sort_values('total', ascending=False).reset_index()
+
+    def finish(self):
+        """
+        Prints the profile report and writes the profile files.
+        """
+        atexit.unregister(self.finish)
+        if self.profile is not None:
+            self.profile.disable()
+
+        phases = pd.DataFrame(
+            self.phases, columns=['phase', 'wall_time', 'cpu_time']
+            )
+        api_calls = self.summarise_api_calls()
+        print("\n")
+        print("#############################################################")
+        print(">>>>>   Session Profile                                 <<<<<")
+        print("#############################################################")
+        print("\nPhases (seconds)\n")
+        print(phases.round(3).to_string(index=False))
+        print("\nGoogle API Calls (seconds)\n")
+        print(api_calls.round(3).to_string(index=False))
+        print("\n")
+
+        if self.stats_path:
+            try:
+                stats_dir = os.path.dirname(self.stats_path)
+                if stats_dir:
+                    os.makedirs(stats_dir, exist_ok=True)
+                self.profile.dump_stats(self.stats_path)
+                timings_path = f"{os.path.splitext(self.stats_path)[0]}.json"
+                with open(timings_path, 'w') as timings_file:
+                    json.dump(
+                        {'phases': self.phases, 'api_calls': self.api_calls},
+                        timings_file, indent=2
+                        )
+                print(f"Profile written to {self.stats_path}\n")
+            except OSError as e:
+                print(f"Unable to write the profile: {e}")
+
+
+def api_call_name(method, url):
+    """
+    Names a Google API request by its method and endpoint, leaving out
+    the spreadsheet ID, cell ranges and query string so that calls to the
+    same endpoint are totalled together.
+
+    Args:
+    - method (str): The HTTP method.
+    - url (str): The request URL.
+
+    Returns:
+    - str: The name of the call, such as
+      'POST sheets/v4/spreadsheets/{id}/values/{range}:append'.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = re.sub(r'/spreadsheets/[^/:]+', '/spreadsheets/{id}', parts.path)
+    path = re.sub(r'/values/[^/:]+', '/values/{range}', path)
+    path = re.sub(r'/files/[^/:]+', '/files/{id}', path)
+    service = parts.netloc.split('.')[0]
+    return f"{method} {service}{path}"
+
+
+# Profiler shared by the whole session, turned on by --profile
+PROFILER = SessionProfiler()
+
+
+# Authorized Google clients shared by the whole process, so the token
+# is minted once and connections are kept alive between requests
+GOOGLE_CLIENTS = {}
+
+
+def get_google_clients(credentials_path):
+    """
+    Returns the process wide Google credentials and gspread client,
+    creating them on first use.
+
+    The gspread client runs on a single authorized requests session with
+    a pooled HTTP adapter, so every Sheets and Drive request reuses the
+    same keep-alive connections.
+
+    Args:
+    - credentials_path (str): The file path to the JSON file containing
+      the service account credentials.
+
+    Returns:
+    - tuple: The scoped credentials and the gspread client.
+    """
+    if credentials_path not in GOOGLE_CLIENTS:
+        SCOPED_CREDS = service_account.Credentials.from_service_account_file(
+            credentials_path
+            ).with_scopes(SCOPE)
+        session = google_requests.AuthorizedSession(SCOPED_CREDS)
+        session.mount(
+            'https://', requests_adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=10
+                )
+            )
+        if PROFILER.enabled:
+            session.request = PROFILER.timed_request(session.request)
+        GSPREAD_CLIENT = gspread.authorize(SCOPED_CREDS, session=session)
+        GOOGLE_CLIENTS[credentials_path] = (SCOPED_CREDS, GSPREAD_CLIENT)
+
+    return GOOGLE_CLIENTS[credentials_path]
+
+
+def get_sheets_service(SCOPED_CREDS):
+    """
+    Returns the process wide Google Sheets v4 service, creating it on
+    first use.
+
+    The service shares the credentials, and so the access token, of the
+    gspread client. The API client library sends its requests through
+    httplib2 rather than requests, so it keeps its own keep-alive
+    connection.
+
+    The service is built from the discovery document bundled with the
+    API client library, so no discovery request is made over the
+    network.
+
+    Args:
+    - SCOPED_CREDS (Credentials): The shared scoped credentials.
+
+    Returns:
+    - googleapiclient.discovery.Resource: The Sheets v4 service.
+    """
+    if 'sheets_v4' not in GOOGLE_CLIENTS:
+        http = google_auth_httplib2.AuthorizedHttp(
+            SCOPED_CREDS, http=httplib2.Http()
+            )
+        if PROFILER.enabled:
+            http.request = PROFILER.timed_request(
+                http.request, method_position=1, url_position=0
+                )
+        GOOGLE_CLIENTS['sheets_v4'] = discovery.build(
+            'sheets', 'v4', http=http,
+            static_discovery=True, cache_discovery=False
+            )
+
+    return GOOGLE_CLIENTS['sheets_v4']
+
+
+def reset_google_connections():
+    """
+    Drops the pooled connections of the Google clients in a forked
+    process, so it opens its own rather than sharing the parent's. The
+    credentials, and so the access token, are kept.
+    """
+    for key, clients in GOOGLE_CLIENTS.items():
+        if key == 'sheets_v4':
+            clients._http.http.connections.clear()
+        else:
+            clients[1].http_client.session.close()
+
+
+os.register_at_fork(after_in_child=reset_google_connections)
 
 
 # Define the function to check Google Sheet access
@@ -22,25 +474,19 @@ def check_google_sheet_access(credentials_path, sheet_name):
     sheet_name (str): The name of the Google Sheet to be accessed.
 
     Returns:
-    gspread.models.Worksheet: The first worksheet object if the Google Sheet
-    is successfully accessed.
+    tuple: The shared scoped credentials and the spreadsheet object if
+    the Google Sheet is successfully accessed.
     None: If access to the Google Sheet fails, returns None and prints an
     error message.
     """
-    scope = ["https://spreadsheets.google.com/feeds",
-             "https://www.googleapis.com/auth/drive"]
-
     try:
         # Load credentials
-        creds = ServiceAccountCredentials.from_json_keyfile_name(
-            credentials_path, scope
-            )
-        client = gspread.authorize(creds)
+        SCOPED_CREDS, client = get_google_clients(credentials_path)
 
         # Access the Google Sheet
-        sheet = client.open(sheet_name).sheet1  # Access the first sheet
+        sheet = client.open(sheet_name)
         print("Successfully accessed the Google Sheet!")
-        return sheet
+        return SCOPED_CREDS, sheet
 
     except FileNotFoundError as e:
         print(
@@ -95,50 +541,48 @@ def initialise_google_sheets():
     to each worksheet tab.
 
     Returns:
-    tuple: A tuple containing the initialized Google Sheets variables,
-    worksheet objects, and URLs for the relevant worksheet tabs.
+    tuple: A tuple containing the GoogleSheetsBackend for the Google
+    Sheet, the worksheet objects, and URLs for the relevant worksheet tabs.
     If initialization fails, returns None and prints an error message.
     """
     print("\n#######################################")
     print("Initialising Necessary Files To Run App")
     print("#######################################\n")
 
-    sheet = check_google_sheet_access('creds.json',
-                                      'marine_data_m2')
+    sheet_access = check_google_sheet_access('creds.json',
+                                             'marine_data_m2')
 
-    if sheet is not None:
+    if sheet_access is not None:
         print("Starting Google Sheet Initialisation\n")
 
-        # After successful access, declare all the variables
-        SCOPE = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive.file",
-            "https://www.googleapis.com/auth/drive"
-            ]
-
-        # Set up authorization for access to Google Sheets
-        CREDS = Credentials.from_service_account_file('creds.json')
-        SCOPED_CREDS = CREDS.with_scopes(SCOPE)
-        GSPREAD_CLIENT = gspread.authorize(SCOPED_CREDS)
-        SHEET = GSPREAD_CLIENT.open('marine_data_m2')
+        # Reuse the authorized client and spreadsheet opened by the
+        # access check
+        SCOPED_CREDS, SHEET = sheet_access
 
         # Define the variables used to access each of the sheets in
-        # the Google Sheet
-        unvalidated_master_data = SHEET.worksheet(
+        # the Google Sheet, from a single metadata request
+        worksheets, empty_titles = open_worksheets(SHEET, [
+            'marine_data_master_data_2020_2024', 'validated_master_data',
+            'user_data_output', 'session_log', 'gael_force_error_log',
+            'date_time_error_log', 'graphical_output_data',
+            'atmos_outliers', 'wind_outliers', 'wave_outliers',
+            'temp_outliers'
+            ])
+        unvalidated_master_data = worksheets[
             'marine_data_master_data_2020_2024'
-            )
-        validated_master_data = SHEET.worksheet('validated_master_data')
-        user_data_output = SHEET.worksheet('user_data_output')
-        session_log = SHEET.worksheet('session_log')
-        error_log = SHEET.worksheet('gael_force_error_log')
-        date_time_error_log = SHEET.worksheet('date_time_error_log')
-        graphical_output_sheet = SHEET.worksheet('graphical_output_data')
+            ]
+        validated_master_data = worksheets['validated_master_data']
+        user_data_output = worksheets['user_data_output']
+        session_log = worksheets['session_log']
+        error_log = worksheets['gael_force_error_log']
+        date_time_error_log = worksheets['date_time_error_log']
+        graphical_output_sheet = worksheets['graphical_output_data']
 
         # Define the sheets to be used for outlier output
-        atmos_outlier_log = SHEET.worksheet('atmos_outliers')
-        wind_outlier_log = SHEET.worksheet('wind_outliers')
-        wave_outlier_log = SHEET.worksheet('wave_outliers')
-        temp_outlier_log = SHEET.worksheet('temp_outliers')
+        atmos_outlier_log = worksheets['atmos_outliers']
+        wind_outlier_log = worksheets['wind_outliers']
+        wave_outlier_log = worksheets['wave_outliers']
+        temp_outlier_log = worksheets['temp_outliers']
 
         # define url links to each worksheet tab
         google_worksheet = (
@@ -223,20 +667,20 @@ def initialise_google_sheets():
             "edit?usp=sharing2079660690"
         )
 
-        # Clear the contents of the sheets
+        # Clear the contents of the sheets in one request
+        storage = GoogleSheetsBackend(SHEET, SCOPED_CREDS)
         sheets = [
             validated_master_data, user_data_output, session_log, error_log,
             atmos_outlier_log, wind_outlier_log, wave_outlier_log,
             temp_outlier_log, date_time_error_log, graphical_output_sheet
             ]
-        for sheet in sheets:
-            sheet.clear()
+        storage.clear_worksheets(sheets, empty_titles)
 
         print("Finished Google Sheet Initialisation\n")
 
         # Return the variables
         return (
-                SHEET, SCOPED_CREDS, unvalidated_master_data,
+                storage, unvalidated_master_data,
                 validated_master_data,
                 user_data_output, session_log, error_log,
                 date_time_error_log, graphical_output_sheet,
@@ -251,17 +695,407 @@ def initialise_google_sheets():
         print("Failed to initialize Google Sheets due to an error.")
 
 
+def open_worksheets(SHEET, titles):
+    """
+    Opens the named worksheets of a spreadsheet with a single metadata
+    request.
+
+    The request also returns cell A1 of each worksheet, which is used to
+    tell which worksheets are already empty, as every tab in the app is
+    written from A1.
+
+    Args:
+    - SHEET (gspread.Spreadsheet): The spreadsheet containing the
+      worksheets.
+    - titles (list of str): The titles of the worksheets to open.
+
+    Returns:
+    - tuple: A dict of the worksheet objects keyed by title, and a set of
+      the titles of the worksheets that are empty.
+
+    Raises:
+    - gspread.exceptions.WorksheetNotFound: If a worksheet is missing.
+    """
+    metadata = SHEET.fetch_sheet_metadata(params={
+        'includeGridData': 'true',
+        'ranges': [f"'{title}'!A1" for title in titles],
+        'fields': 'sheets(properties,data(rowData(values(formattedValue))))'
+        })
+
+    worksheets = {}
+    empty_titles = set()
+    for sheet in metadata.get('sheets', []):
+        title = sheet['properties']['title']
+        worksheets[title] = gspread.Worksheet(
+            SHEET, sheet['properties'], SHEET.id, SHEET.client
+            )
+        if not sheet.get('data', [{}])[0].get('rowData'):
+            empty_titles.add(title)
+
+    for title in titles:
+        if title not in worksheets:
+            raise gspread.exceptions.WorksheetNotFound(title)
+
+    return worksheets, empty_titles
+
+
+class GoogleSheetsBackend:
+    """
+    Storage backend for the worksheets of the Google Sheet.
+
+    Provides the operations the app runs on whole worksheets, which
+    LocalBackend provides for local storage, so the pipeline runs the same
+    way on either backend. Cells are read and written through the
+    gspread Worksheet objects themselves.
+    """
+
+    # The spreadsheet, and the sheet of it that the chart is drawn on
+    SPREADSHEET_ID = '1cjDvLdeYgYip8yfg4w531LKcoRlo8t8gb8esrI30H6U'
+    CHART_SHEET_ID = 2079660690
+
+    def __init__(self, spreadsheet, credentials):
+        self.spreadsheet = spreadsheet
+        self.credentials = credentials
+
+    def clear_worksheets(self, sheets, empty_titles=()):
+        """
+        Clears the contents of several worksheets with a single batch
+        clear request, skipping worksheets that are already empty.
+
+        Args:
+        - sheets (list of gspread.models.Worksheet): The worksheets to
+          clear.
+        - empty_titles (set of str, optional): The titles of worksheets
+          known to be empty. Defaults to none.
+        """
+        ranges = [
+            f"'{sheet.title}'" for sheet in sheets
+            if sheet.title not in empty_titles
+            ]
+        if ranges:
+            self.spreadsheet.values_batch_clear(body={'ranges': ranges})
+
+    def write_dataframe(self, worksheet, df):
+        """
+        Replaces the contents of a worksheet with a dataframe, including
+        its header row.
+
+        Args:
+        - worksheet (gspread.models.Worksheet): The worksheet to write to.
+        - df (pd.DataFrame): The dataframe to be written.
+        """
+        gspread_dataframe.set_with_dataframe(worksheet, df)
+
+    def write_chart(self, worksheet, x_col, y_cols, title, values):
+        """
+        Writes the chart data and redraws the chart in a single request.
+
+        Args:
+        - worksheet (gspread.models.Worksheet): The chart data worksheet.
+        - x_col (str): The name of the x-axis column.
+        - y_cols (list of str): The names of the y-axis columns.
+        - title (str): The title of the chart.
+        - values (list): The rows of chart data, from build_chart_values.
+        """
+        service = get_sheets_service(self.credentials)
+        refresh_chart(
+            service, self.SPREADSHEET_ID, self.CHART_SHEET_ID, x_col, y_cols,
+            title, values
+            )
+        print("Chart has been created in the Google Sheet")
+
+
+class LocalWorksheet:
+    """
+    A worksheet stored in a local SQLite file.
+
+    Implements the part of the gspread Worksheet interface used by the
+    app, so the whole pipeline can run without Google Sheets. Each row is
+    stored as a JSON list of cell strings, in the same form that
+    get_all_values returns them from Google Sheets.
+    """
+
+    # The worksheets share one connection, which the background writers
+    # use as well, so only one thread writes through it at a time
+    write_lock = threading.RLock()
+
+    def __init__(self, connection, title, sheet_id):
+        self.connection = connection
+        self.title = title
+        self.id = sheet_id
+
+    def _rows(self):
+        cursor = self.connection.execute(
+            "SELECT data FROM worksheet_rows WHERE sheet = ? ORDER BY row",
+            (self.title,)
+            )
+        return [json.loads(data) for (data,) in cursor]
+
+    @property
+    def row_count(self):
+        cursor = self.connection.execute(
+            "SELECT COALESCE(MAX(row), 0) FROM worksheet_rows "
+            "WHERE sheet = ?", (self.title,)
+            )
+        return cursor.fetchone()[0]
+
+    @property
+    def col_count(self):
+        return max((len(row) for row in self._rows()), default=0)
+
+    def get_all_values(self):
+        """
+        Returns every row in the worksheet as a list of lists of strings.
+        """
+        rows = self._rows()
+        width = max((len(row) for row in rows), default=0)
+        return [row + [''] * (width - len(row)) for row in rows]
+
+    def row_values(self, row):
+        """
+        Returns the values in a single row, numbered from 1.
+        """
+        cursor = self.connection.execute(
+            "SELECT data FROM worksheet_rows WHERE sheet = ? AND row = ?",
+            (self.title, row)
+            )
+        result = cursor.fetchone()
+        return json.loads(result[0]) if result else []
+
+    def get_values(self, range_name):
+        """
+        Returns the values in an A1 range such as 'A5:K' or 'A5:K9'.
+        """
+        grid = gspread.utils.a1_range_to_grid_range(range_name)
+        start_row = grid.get('startRowIndex', 0) + 1
+        end_row = grid.get('endRowIndex', self.row_count)
+        start_col = grid.get('startColumnIndex', 0)
+        end_col = grid.get('endColumnIndex')
+        cursor = self.connection.execute(
+            "SELECT data FROM worksheet_rows WHERE sheet = ? "
+            "AND row BETWEEN ? AND ? ORDER BY row",
+            (self.title, start_row, end_row)
+            )
+        return [json.loads(data)[start_col:end_col] for (data,) in cursor]
+
+    def update(self, values, range_name='A1'):
+        """
+        Writes a list of lists of values starting at the given cell.
+        """
+        start_row, start_col = gspread.utils.a1_to_rowcol(range_name)
+        with self.write_lock, self.connection:
+            for offset, new_values in enumerate(values):
+                row = start_row + offset
+                cells = self.row_values(row)
+                cells += [''] * (start_col - 1 + len(new_values) - len(cells))
+                for col, value in enumerate(new_values, start=start_col - 1):
+                    cells[col] = '' if value is None else str(value)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO worksheet_rows (sheet, row, data) "
+                    "VALUES (?, ?, ?)",
+                    (self.title, row, json.dumps(cells))
+                    )
+
+    def append_rows(self, values, table_range='A1'):
+        """
+        Writes a list of lists of values after the last row in the
+        worksheet, returning the range written as the API does.
+        """
+        with self.write_lock:
+            start_row = self.row_count + 1
+            self.update(values, f"A{start_row}")
+        return {
+            'updates': {
+                'updatedRange':
+                    f"{self.title}!A{start_row}:A{start_row + len(values) - 1}"
+                }
+            }
+
+    def clear(self):
+        """
+        Removes every row from the worksheet.
+        """
+        with self.write_lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM worksheet_rows WHERE sheet = ?", (self.title,)
+                )
+
+
+class LocalBackend:
+    """
+    Storage backend for the worksheets held in a local SQLite file.
+
+    Provides the same operations as GoogleSheetsBackend, for
+    LocalWorksheet objects or any worksheet with the same interface.
+    """
+
+    def clear_worksheets(self, sheets, empty_titles=()):
+        """
+        Clears the contents of several worksheets, one by one.
+
+        Args:
+        - sheets (list of LocalWorksheet): The worksheets to clear.
+        - empty_titles (set of str, optional): The titles of worksheets
+          known to be empty. Defaults to none.
+        """
+        for sheet in sheets:
+            if sheet.title not in empty_titles:
+                sheet.clear()
+
+    def write_dataframe(self, worksheet, df):
+        """
+        Replaces the contents of a worksheet with a dataframe, including
+        its header row.
+
+        Args:
+        - worksheet (LocalWorksheet): The worksheet to write to.
+        - df (pd.DataFrame): The dataframe to be written.
+        """
+        worksheet.clear()
+        worksheet.update(df_to_list_of_lists(df.fillna('')), 'A1')
+
+    def write_chart(self, worksheet, x_col, y_cols, title, values):
+        """
+        Writes the chart data. Local storage has no charts, so no chart
+        is drawn.
+
+        Args:
+        - worksheet (LocalWorksheet): The chart data worksheet.
+        - x_col (str): The name of the x-axis column.
+        - y_cols (list of str): The names of the y-axis columns.
+        - title (str): The title of the chart.
+        - values (list): The rows of chart data, from build_chart_values.
+        """
+        worksheet.clear()
+        worksheet.update(values, 'A1')
+        print("Chart data has been written to local storage")
+
+
+def initialise_local_sheets(db_path):
+    """
+    Initializes the local SQLite storage used in place of Google Sheets.
+
+    Opens the database, creating it if needed, and returns the same
+    variables as initialise_google_sheets, with each worksheet replaced by
+    a LocalWorksheet. If the master data table is empty it is loaded from
+    LOCAL_MASTER_DATA_CSV when that file exists.
+
+    Args:
+    - db_path (str): The file path of the SQLite database.
+
+    Returns:
+    tuple: A tuple containing the LocalBackend for the database, the
+    worksheet objects and descriptions of where each worksheet is stored.
+    """
+    print("\n#######################################")
+    print("Initialising Necessary Files To Run App")
+    print("#######################################\n")
+    print(f"Using local storage: {db_path}\n")
+
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS worksheet_rows ("
+            "sheet TEXT NOT NULL, row INTEGER NOT NULL, data TEXT NOT NULL, "
+            "PRIMARY KEY (sheet, row))"
+            )
+
+    titles = [
+        'marine_data_master_data_2020_2024', 'validated_master_data',
+        'user_data_output', 'session_log', 'gael_force_error_log',
+        'date_time_error_log', 'graphical_output_data', 'atmos_outliers',
+        'wind_outliers', 'wave_outliers', 'temp_outliers'
+        ]
+    worksheets = [
+        LocalWorksheet(connection, title, sheet_id)
+        for sheet_id, title in enumerate(titles)
+        ]
+    (unvalidated_master_data, validated_master_data, user_data_output,
+     session_log, error_log, date_time_error_log, graphical_output_sheet,
+     atmos_outlier_log, wind_outlier_log, wave_outlier_log,
+     temp_outlier_log) = worksheets
+
+    # A forked process opens its own connection to the database
+    def reconnect():
+        connection = sqlite3.connect(db_path, check_same_thread=False)
+        for worksheet in worksheets:
+            worksheet.connection = connection
+
+    os.register_at_fork(after_in_child=reconnect)
+
+    # Load the master data from the exported CSV on first use
+    if unvalidated_master_data.row_count == 0 and os.path.exists(
+            LOCAL_MASTER_DATA_CSV):
+        print(f"Importing master data from {LOCAL_MASTER_DATA_CSV}\n")
+        with open(LOCAL_MASTER_DATA_CSV, newline='') as csv_file:
+            unvalidated_master_data.update(list(csv.reader(csv_file)), 'A1')
+
+    if unvalidated_master_data.row_count == 0:
+        print(
+            f"Error: There is no master data in {db_path}."
+            f"\n\nWithout access to the master data the app will not run"
+            f"\nApplication Ending......... Bye\n"
+            )
+        exit()
+
+    # Clear the contents of the output sheets
+    storage = LocalBackend()
+    storage.clear_worksheets(worksheets[1:])
+
+    print("Finished Local Storage Initialisation\n")
+
+    # Describe where each worksheet is stored, in place of the URLs
+    locations = [
+        f"Worksheet: marine_data_m2 - Local: {db_path}"
+        ] + [
+        f"Tab: {title} - Local: {db_path}"
+        for title in [
+            'marine_data_master_data_2020_2024', 'validated_master_data',
+            'user_data_output', 'session_log', 'gael_force_error_log',
+            'atmos_outliers', 'wind_outliers', 'wave_outliers',
+            'temp_outliers', 'date_time', 'graphical_output_data'
+            ]
+        ]
+
+    return (
+            storage, unvalidated_master_data,
+            validated_master_data,
+            user_data_output, session_log, error_log,
+            date_time_error_log, graphical_output_sheet,
+            atmos_outlier_log, wind_outlier_log, wave_outlier_log,
+            temp_outlier_log, *locations)
+
+
+def initialise_storage():
+    """
+    Initializes the storage backend selected by STORAGE_BACKEND.
+
+    Both backends provide the same operations on whole worksheets, so
+    the rest of the app uses the backend returned first in the tuple
+    without checking which one it is.
+
+    Returns:
+    tuple: The variables returned by initialise_google_sheets, or by
+    initialise_local_sheets when the local backend is selected.
+    """
+    if STORAGE_BACKEND == 'local':
+        return initialise_local_sheets(LOCAL_DB_FILE)
+    return initialise_google_sheets()
+
+
 def load_marine_data_input_sheet(
         session_log_url, gael_force_error_log_url,
-        session_log, error_log, unvalidated_master_data
+        session_log, error_log, master_data,
+        new_row_count=None
         ):
     """
-    Initializes the session and error logs, then loads and returns
-    the master data.
+    Initializes the session and error logs for the master data loaded
+    from the Google Sheet.
 
     This function logs the start of a session and initializes error tracking by
-    creating entries in the session log and error log. It then loads the master
-    data from the specified Google Sheet into a dataframe.
+    creating entries in the session log and error log. The master data
+    itself is read by load_master_data before this is called, as its
+    revision is needed to decide whether the snapshot can be used.
 
     Args:
     session_log_url (str): The URL link to the session log Google Sheet.
@@ -270,12 +1104,15 @@ def load_marine_data_input_sheet(
     session log.
     error_log (gspread.models.Worksheet): The Google Sheet worksheet
     for the error log.
-    unvalidated_master_data (gspread.models.Worksheet):
-    The worksheet containing the unvalidated master data.
+    master_data (list): The master data read from the worksheet, where
+    the first row contains the column headers.
+    new_row_count (int, optional): The number of rows appended since the
+    snapshot was taken. Defaults to None, when the whole sheet is to be
+    validated or checked for edits.
 
     Returns:
-    tuple: A tuple containing the loaded master data as a dataframe,
-    the session log data, and the error log data.
+    tuple: A tuple containing the master data, the session log data, the
+    error log data, and the number of rows appended since the snapshot.
     """
     print("Opening a session log.\n")
     print(f"The link to the session log is:\n\n{session_log_url}\n\n")
@@ -290,20 +1127,528 @@ def load_marine_data_input_sheet(
     session_log_data.append(['Master Data Started Loading'])
     session_log_data.append([str(pd.Timestamp.now())])
 
-    # Create Dataframe with all data from google input sheet
-    print("     Master Data Loading Start")
-    print
-    master_data = unvalidated_master_data.get_all_values()
-    print("     Master Data Loading Complete\n")
+    if new_row_count is not None:
+        print(f"     Master Data Synced: {new_row_count} new rows\n")
+        session_log_data.append(
+            [f'Master Data Synced Incrementally: {new_row_count} new rows']
+            )
+    else:
+        print(f"     Master Data Loaded: {len(master_data) - 1} rows\n")
     session_log_data.append(['Master Data Finished Loading'])
     session_log_data.append([str(pd.Timestamp.now())])
     print("Master Data Load Completed     <<<<<\n")
 
     # return the dataframe with the master data from the sheet
-    return master_data, session_log_data, error_log_data
+    return master_data, session_log_data, error_log_data, new_row_count
+
+
+def read_master_data(unvalidated_master_data):
+    """
+    Reads every row of the master data worksheet.
+
+    Args:
+    - unvalidated_master_data (gspread.models.Worksheet): The worksheet
+      containing the unvalidated master data.
+
+    Returns:
+    - list: The master data, where the first row contains the column
+      headers.
+      None: If the worksheet could not be read.
+    """
+    try:
+        return unvalidated_master_data.get_all_values()
+    except Exception as e:
+        print(f"Unable to read the master data: {e}")
+        return None
+
+
+def get_master_data_revision(master_data, rows=None):
+    """
+    Builds a revision key for the master data from its contents.
+
+    The Drive modifiedTime of the spreadsheet cannot be used as the key,
+    because every session writes to the log tabs of the same spreadsheet
+    and so changes it, and the grid size of the worksheet does not change
+    when rows are appended into blank rows or when a row is edited. The
+    key is therefore a hash of every value in the rows that hold data, so
+    an append, edit or deletion anywhere in the worksheet changes it.
+    Trailing empty cells are left out, as the API does not return them.
+
+    Args:
+    - master_data (list): The master data, from read_master_data.
+    - rows (int, optional): Only hash this many rows, counting the
+      header row, giving the revision the data had when it had this many
+      rows. Defaults to None, which hashes every row.
 
+    Returns:
+    - str: The revision key.
+    """
+    digest = hashlib.sha1()
+    for row in master_data[:rows]:
+        digest.update('\x1f'.join(row).rstrip('\x1f').encode('utf-8'))
+        digest.update(b'\x1e')
+    return digest.hexdigest()
 
-def check_for_outliers(df):
+
+def load_master_data(unvalidated_master_data, snapshot=None):
+    """
+    Loads the master data, reading as little of the worksheet as it can.
+
+    If there is a snapshot and the last full check is less than
+    FULL_CHECK_HOURS old, only the rows appended since the snapshot was
+    taken are read and merged with the raw rows it holds. Otherwise the
+    whole worksheet is read and hashed, which finds edits and deletions
+    anywhere in it. Edits made between full checks are found by the next
+    full check.
+
+    Args:
+    - unvalidated_master_data (gspread.models.Worksheet): The worksheet
+      containing the unvalidated master data.
+    - snapshot (dict, optional): The snapshot returned by
+      load_master_data_snapshot. Defaults to None.
+
+    Returns:
+    - dict: The master data rows, their revision key, the number of rows
+      appended since the snapshot, which is None if they could not be
+      counted, and the time of the last full check.
+      None: If the worksheet could not be read.
+    """
+    full_check_due = snapshot is None or (
+        time.time() - snapshot['checked_at'] >= FULL_CHECK_HOURS * 3600)
+
+    if not full_check_due:
+        master_data = sync_master_data_tail(unvalidated_master_data, snapshot)
+        if master_data is not None:
+            new_row_count = len(master_data) - snapshot['watermark']
+            revision = snapshot['revision']
+            if new_row_count:
+                revision = get_master_data_revision(master_data)
+            return {
+                'rows': master_data,
+                'revision': revision,
+                'new_row_count': new_row_count,
+                'checked_at': snapshot['checked_at']
+                }
+
+    master_data = read_master_data(unvalidated_master_data)
+    if master_data is None:
+        return None
+
+    revision = get_master_data_revision(master_data)
+    checked_at = time.time()
+    new_row_count = None
+    if snapshot is not None:
+        new_row_count = count_appended_rows(master_data, snapshot)
+        # Record the check, so an unchanged sheet is not read in full
+        # again until the next check is due
+        if revision == snapshot['revision']:
+            snapshot['checked_at'] = checked_at
+            write_master_data_snapshot(snapshot)
+
+    return {
+        'rows': master_data,
+        'revision': revision,
+        'new_row_count': new_row_count,
+        'checked_at': checked_at
+        }
+
+
+def load_master_data_snapshot():
+    """
+    Loads the local snapshot of the master data.
+
+    Returns:
+    - dict: The snapshot, containing the revision, the row watermark, the
+      raw and validated master data, the validation logs and the
+      aggregate cube.
+      None: If there is no snapshot, it is unreadable or it was written
+      in an older format.
+    """
+    if not os.path.exists(SNAPSHOT_FILE):
+        return None
+
+    try:
+        snapshot = pd.read_pickle(SNAPSHOT_FILE)
+    except Exception as e:
+        print(f"Unable to read the local master data snapshot: {e}")
+        return None
+
+    # Ignore snapshots written in an older format
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+
+    return snapshot
+
+
+def sync_master_data_tail(unvalidated_master_data, snapshot):
+    """
+    Fetches only the rows appended to the master data worksheet since the
+    snapshot was taken, and merges them with the raw data in the snapshot.
+
+    The range read starts at the watermark, the last row already held
+    locally, so the first row returned must match the last row of the
+    snapshot. If it does not, rows have been deleted or the last row
+    edited, and None is returned so the full sheet is read instead.
+
+    Args:
+    - unvalidated_master_data (gspread.models.Worksheet): The worksheet
+      containing the unvalidated master data.
+    - snapshot (dict): The snapshot returned by load_master_data_snapshot.
+
+    Returns:
+    - list: The merged master data, where the first row contains the
+      column headers.
+      None: If the worksheet could not be synced incrementally.
+    """
+    raw = snapshot['raw']
+    if raw.empty:
+        return None
+
+    header = raw.columns.tolist()
+    watermark = snapshot['watermark']
+    last_column = gspread.utils.rowcol_to_a1(1, len(header)).rstrip('1')
+
+    try:
+        tail = unvalidated_master_data.get_values(
+            f"A{watermark}:{last_column}"
+            )
+    except Exception as e:
+        print(f"Unable to fetch the new master data rows: {e}")
+        return None
+
+    # Pad short rows, as trailing empty cells are not returned by the API
+    tail = [row + [''] * (len(header) - len(row)) for row in tail]
+    if not tail or tail[0] != raw.iloc[-1].tolist():
+        print("     The last synced row has changed, reading the full sheet\n")
+        return None
+
+    return [header] + raw.values.tolist() + tail[1:]
+
+
+def count_appended_rows(master_data, snapshot):
+    """
+    Counts the rows appended to the master data since the snapshot was
+    taken.
+
+    The snapshot records the revision of the master data and how many
+    rows it had, its watermark. If rows have only been appended since,
+    the revision of the first watermark rows of the master data is the
+    revision in the snapshot. If any row up to the watermark has been
+    edited or deleted it is not, and None is returned so the edited rows
+    are found and validated again.
+
+    Args:
+    - master_data (list): The master data, from read_master_data.
+    - snapshot (dict): The snapshot returned by load_master_data_snapshot.
+
+    Returns:
+    - int: The number of rows appended since the snapshot.
+      None: If the master data cannot be validated incrementally.
+    """
+    watermark = snapshot['watermark']
+    if len(master_data) < watermark or get_master_data_revision(
+            master_data, watermark) != snapshot['revision']:
+        print("     Master data has been edited, checking the edited rows\n")
+        return None
+
+    return len(master_data) - watermark
+
+
+def save_master_data_snapshot(
+        revision, master_data, validated_df, validation_logs,
+        aggregate_cube, outlier_detectors=None, validation_state=None,
+        checked_at=None
+        ):
+    """
+    Saves the raw and validated master data, the validation logs, the
+    aggregate cube, the outlier detectors and the validation state to the
+    local snapshot file, keyed by the master data revision. The number of
+    rows of the master data is kept as the watermark.
+
+    Args:
+    - revision (str): The revision key of the master data worksheet.
+    - master_data (list): The raw master data, where the first row
+      contains the column headers.
+    - validated_df (pd.DataFrame): The validated master data.
+    - validation_logs (dict): The session, error, date-time and outlier
+      logs produced by the validation.
+    - aggregate_cube (dict): The aggregate cube of the validated data.
+    - outlier_detectors (dict, optional): The outlier detectors holding
+      the running statistics of the validated rows. Defaults to None.
+    - validation_state (dict, optional): The outcome of each source row
+      validated, from new_validation_state. Defaults to None.
+    - checked_at (float, optional): The time the whole worksheet was
+      last read and checked for edits. Defaults to None, which is now.
+    """
+    if revision is None or validated_df.empty:
+        return
+
+    header = master_data[0]
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'revision': revision,
+        'watermark': len(master_data),
+        'checked_at': time.time() if checked_at is None else checked_at,
+        'raw': pd.DataFrame(
+            [row + [''] * (len(header) - len(row)) for row in master_data[1:]],
+            columns=header
+            ),
+        'validated': validated_df,
+        'logs': validation_logs,
+        'cube': aggregate_cube,
+        'outlier_detectors': outlier_detectors or {},
+        'validation': validation_state or new_validation_state()
+        }
+
+    if write_master_data_snapshot(snapshot):
+        print("     Master data snapshot saved locally\n")
+
+
+def write_master_data_snapshot(snapshot):
+    """
+    Writes the snapshot to the local snapshot file.
+
+    Args:
+    - snapshot (dict): The snapshot to write.
+
+    Returns:
+    - bool: True if the snapshot was written, otherwise False.
+    """
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        # Write to a temporary file first so a partial write never
+        # replaces a good snapshot
+        temp_file = f"{SNAPSHOT_FILE}.tmp"
+        pd.to_pickle(snapshot, temp_file)
+        os.replace(temp_file, SNAPSHOT_FILE)
+        return True
+    except Exception as e:
+        print(f"Unable to save the local master data snapshot: {e}")
+        return False
+
+
+def restore_master_data_snapshot(
+        storage, snapshot, session_log_url, gael_force_error_log_url,
+        session_log, error_log, date_time_error_log,
+        validated_master_data, validated_master_data_url,
+        atmos_outlier_log, atmos_outliers_url,
+        wind_outlier_log, wind_outliers_url,
+        wave_outlier_log, wave_outliers_url,
+        temp_outlier_log, temp_outliers_url
+        ):
+    """
+    Restores the validated master data from the local snapshot.
+
+    The output tabs are cleared at the start of each session, so the
+    logs, outliers and validated data recorded in the snapshot are written
+    back to Google Sheets, in the background by SHEET_WRITER. The
+    validation of the master data is skipped.
+
+    Args:
+    - storage (GoogleSheetsBackend or LocalBackend): The storage backend
+      the worksheets belong to.
+    - snapshot (dict): The snapshot returned by load_master_data_snapshot.
+    - session_log_url (str): The URL link to the session log.
+    - gael_force_error_log_url (str): The URL link to the error log.
+    - session_log (gspread.models.Worksheet): The session log worksheet.
+    - error_log (gspread.models.Worksheet): The error log worksheet.
+    - date_time_error_log (gspread.models.Worksheet): The date-time error
+      log worksheet.
+    - validated_master_data (gspread.models.Worksheet): The worksheet
+      where the validated master data will be written.
+    - validated_master_data_url (str): The URL of the validated master data.
+    - atmos_outlier_log, wind_outlier_log, wave_outlier_log,
+      temp_outlier_log (gspread.models.Worksheet): The outlier worksheets.
+    - atmos_outliers_url, wind_outliers_url, wave_outliers_url,
+      temp_outliers_url (str): The URL links to the outlier worksheets.
+
+    Returns:
+    - pd.DataFrame: The validated master data from the snapshot.
+    """
+    print("Opening a session log.\n")
+    print(f"The link to the session log is:\n\n{session_log_url}\n\n")
+    print("Opening a error log.\n")
+    print(f"The link to the error log is:\n\n{gael_force_error_log_url}\n\n")
+    print("\nMaster Data Unchanged - Loading Local Snapshot     <<<<<\n")
+
+    logs = snapshot['logs']
+    session_log_data = [
+        ['Session Log Started'], [str(pd.Timestamp.now())],
+        ['Master Data Unchanged - Loaded From Local Snapshot'],
+        [str(pd.Timestamp.now())]
+        ] + logs['session_log']
+
+    write_outlier_logs(
+        logs['outliers'],
+        atmos_outlier_log, atmos_outliers_url,
+        wind_outlier_log, wind_outliers_url,
+        wave_outlier_log, wave_outliers_url,
+        temp_outlier_log, temp_outliers_url
+        )
+    update_all_logs(
+        session_log_data, logs['error_log'],
+        logs['date_time_error_log'], session_log, error_log,
+        date_time_error_log
+        )
+
+    validated_data_df = snapshot['validated'].copy()
+    print("Writing Validated Data To Google Sheets In The Background <<<<<\n")
+    SHEET_WRITER.submit(
+        'validated master data', storage.write_dataframe,
+        validated_master_data, validated_data_df, phase='validated_upload'
+        )
+    print(
+        f"    \nThe validated master data is written here:\n\n"
+        f"{validated_master_data_url}\n\n"
+        )
+    print("\n")
+    print("#############################################################")
+    print("   >>>>>   Phase 1. Completed Data Validation Process   <<<<<")
+    print("#############################################################")
+    print("\n")
+
+    return validated_data_df
+
+
+class OutlierDetector:
+    """
+    Finds outliers in a group of measurement columns as rows are added,
+    without recomputing the statistics of the rows already seen.
+
+    By default a value is an outlier when it is more than OUTLIER_THRESHOLD
+    standard deviations from the mean of its column, the same test as
+    check_for_outliers. The mean and variance of each column are kept as
+    running totals and combined with each batch of new rows using the
+    parallel form of Welford's algorithm. New rows are scored on arrival.
+    As the statistics move, a row seen before can only change between
+    outlier and not outlier if its value lies between the old and new
+    limits, so only those rows are scored again. The result matches
+    scipy.stats.zscore over all the rows, up to floating point rounding.
+
+    When window is set, each row is instead scored once, on arrival,
+    against the mean and standard deviation of the window rows up to and
+    including it.
+    """
+
+    def __init__(self, threshold=3, window=None):
+        self.threshold = threshold
+        self.window = window
+        self.count = 0
+        self.mean = None
+        self.m2 = None
+        self.column_flags = None
+
+    def std(self):
+        """
+        Returns the population standard deviation of each column.
+        """
+        return np.sqrt(self.m2 / self.count)
+
+    def score(self, values, mean, std):
+        """
+        Flags the values more than threshold standard deviations from the
+        mean. Nothing is flagged when the standard deviation is zero.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.abs((values - mean) / std) > self.threshold
+
+    def update(self, values):
+        """
+        Adds the new rows and returns the outlier flags of every row.
+
+        Args:
+        - values (np.ndarray): All the rows seen so far, one column per
+          measurement. The first count rows must be the rows passed in
+          earlier calls, in the same order, and the rows after them are
+          new.
+
+        Returns:
+        - np.ndarray: A boolean flag for each row, True when the row has
+          an outlier in any column.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        new_values = values[self.count:]
+        num_old, num_new = self.count, len(new_values)
+
+        if self.mean is None:
+            self.mean = np.zeros(values.shape[1])
+            self.m2 = np.zeros(values.shape[1])
+            self.column_flags = np.zeros(values.shape, dtype=bool)[:0]
+
+        if num_new == 0:
+            return self.column_flags.any(axis=1)
+
+        old_mean = self.mean
+        old_std = self.std() if num_old else None
+
+        # Combine the running totals with those of the new rows
+        new_mean = new_values.mean(axis=0)
+        new_m2 = ((new_values - new_mean) ** 2).sum(axis=0)
+        total = num_old + num_new
+        delta = new_mean - old_mean
+        self.mean = old_mean + delta * num_new / total
+        self.m2 = self.m2 + new_m2 + delta ** 2 * num_old * num_new / total
+        self.count = total
+
+        if self.window:
+            new_flags = self.score_window(values, num_old)
+        else:
+            new_flags = self.score(new_values, self.mean, self.std())
+        self.column_flags = np.concatenate([self.column_flags, new_flags])
+
+        if not self.window and num_old:
+            self.rescore(values[:num_old], old_mean, old_std)
+
+        return self.column_flags.any(axis=1)
+
+    def rescore(self, old_values, old_mean, old_std):
+        """
+        Scores again the rows seen before whose value lies between the
+        limits of the old and new statistics.
+        """
+        std = self.std()
+        for col in range(old_values.shape[1]):
+            column = old_values[:, col]
+            if old_std[col] == 0 or std[col] == 0:
+                # Nothing was flagged, or nothing can be, so the limits
+                # do not bound the rows that change
+                candidates = np.arange(len(column))
+            else:
+                old_limits = old_mean[col] + np.array([-1, 1]) * (
+                    self.threshold * old_std[col]
+                    )
+                new_limits = self.mean[col] + np.array([-1, 1]) * (
+                    self.threshold * std[col]
+                    )
+                # Widen the bands slightly so rounding never hides a row
+                slack = 1e-9 * (np.abs(new_limits) + std[col])
+                low = np.minimum(old_limits, new_limits) - slack
+                high = np.maximum(old_limits, new_limits) + slack
+                candidates = np.flatnonzero(
+                    ((column >= low[0]) & (column <= high[0])) |
+                    ((column >= low[1]) & (column <= high[1]))
+                    )
+            self.column_flags[candidates, col] = self.score(
+                column[candidates], self.mean[col], std[col]
+                )
+
+    def score_window(self, values, num_old):
+        """
+        Scores the new rows against the rolling window statistics. Each
+        new row is scored against the window of rows ending with, and
+        including, that row. Only the window - 1 rows before the first new
+        row are read from the older rows, to fill the first windows.
+        """
+        start = max(0, num_old - self.window + 1)
+        rolling = pd.DataFrame(values[start:]).rolling(
+            self.window, min_periods=1
+            )
+        mean = rolling.mean().to_numpy()[num_old - start:]
+        std = rolling.std(ddof=0).to_numpy()[num_old - start:]
+        return self.score(values[num_old:], mean, std)
+
+
+def check_for_outliers(df, detector=None):
     """
     Identifies outliers in a given DataFrame using the Z-Score method.
 
@@ -314,67 +1659,334 @@ def check_for_outliers(df):
     typically considered to be statistically significant deviations
     from the mean.
 
+    When a detector is given, the rows it has already seen are not scored
+    again from scratch. Only the rows after them are added to its running
+    statistics, with the same result.
+
     Args:
     - df (pandas.DataFrame): The input DataFrame containing numerical
     data to check for outliers.
+    - detector (OutlierDetector, optional): The detector holding the
+    statistics of the leading rows of df from an earlier check. Defaults
+    to None, which scores every row.
     """
-    z_scores = zscore(df)  # calculate a z score for all values in dataframe
+    if detector is not None:
+        outliers = detector.update(df.to_numpy(dtype=np.float64))
+        return df[outliers]
+
+    # calculate a z score for all values in dataframe
+    z_scores = scipy_stats.zscore(df)
     abs_z_scores = abs(z_scores)  # take the absolute value
-    outliers = (abs_z_scores > 3).any(
+    outliers = (abs_z_scores > OUTLIER_THRESHOLD).any(
         axis=1
         )  # creates a bolean based on whether the abs number is  > 3
     return df[outliers]  # return the dataframe of the outliers identified
 
 
 def handle_log_update(
-        update_function, worksheet, data,
-        log_name="", error_log_data=None
+        append_function, worksheet, data,
+        log_name="", error_log_data=None, verbose=True
         ):
     """
     Handles I/O operations with error checking and logging,
     automatically appending data
     to the end of the sheet.
 
+    The data is appended with a single values append request, so the
+    existing contents of the log never need to be read to find the
+    last row.
+
     Args:
-    - update_function (function): Function to perform the I/O operation,
-    typically the update method of the worksheet.
+    - append_function (function): Function to perform the I/O operation,
+    typically the append_rows method of the worksheet.
     - worksheet (object): Google Sheets worksheet object for log operations.
     - data (list): Data to be written or updated.
     - log_name (str): Name of the log for error messages.
     - error_log_data (list, optional): List to store error messages.
     Defaults to None.
+    - verbose (bool, optional): Whether to print a message when the
+    update succeeds. Defaults to True.
     """
     # Initialize error_log_data if it is None
     if error_log_data is None:
         error_log_data = []
 
     try:
-        # Determine the last row in the log to append data
-        last_row = get_last_filled_row(worksheet)
-
-        # Determine the starting cell for new data
-        start_cell = f"A{last_row + 1}"
-
-        # Append data to the sheet using the update function
-        update_function(data, start_cell)
-        print(f"Successfully updated {log_name} at {start_cell}.")
+        # Append data after the table starting at A1 in the sheet
+        response = append_function(data, table_range='A1')
+        updated_range = response.get('updates', {}).get('updatedRange', '')
+        if verbose:
+            print(f"Successfully updated {log_name} at {updated_range}.")
     except Exception as e:
         print(f"Error updating {log_name}: {e}")
         error_log_data.append([f"Error updating {log_name}: {e}"])
 
 
-def get_last_filled_row(worksheet):
+class LogSink:
+    """
+    Buffers log entries and appends them to their log worksheets from a
+    background thread, so the interactive prompts never wait on a Google
+    API call.
+
+    Entries are written at most LOG_FLUSH_INTERVAL seconds after they are
+    buffered, in one request per worksheet, and anything still buffered
+    is written when the application exits.
+
+    The prompts keep adding to the same log list and pass the whole list
+    on each write. The sink remembers how much of each list it has
+    already taken, so every entry is written only once.
     """
-    Retrieves the last filled row in a Google Sheet.
+
+    def __init__(self, flush_interval):
+        self.flush_interval = flush_interval
+        self.pending = {}
+        self.taken = {}
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.thread = None
+        os.register_at_fork(after_in_child=self.after_fork)
+
+    def after_fork(self):
+        """
+        Resets the sink in a forked process, which has no background
+        writer. Entries buffered before the fork are left to the parent.
+        """
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.thread = None
+
+    def write(self, worksheet, log_data, log_name=""):
+        """
+        Buffers the entries of log_data that have not been written yet.
+
+        Args:
+        - worksheet (gspread.models.Worksheet): The log worksheet.
+        - log_data (list): The list of log entries, each a list of values.
+        - log_name (str): Name of the log for error messages.
+        """
+        with self.lock:
+            _, taken = self.taken.get(id(log_data), (log_data, 0))
+            new_rows = log_data[taken:]
+            # Keep a reference to the list so its id is never reused
+            self.taken[id(log_data)] = (log_data, len(log_data))
+            if not new_rows:
+                return
+
+            _, _, rows = self.pending.setdefault(
+                id(worksheet), (worksheet, log_name, [])
+                )
+            rows.extend([[str(item) for item in row] for row in new_rows])
+
+            # Start the background writer on first use
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+                atexit.register(self.flush)
+
+    def run(self):
+        """
+        Writes the buffered entries every flush_interval seconds.
+        """
+        while True:
+            threading.Event().wait(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered entries, one append request per worksheet.
+        """
+        with self.flush_lock:
+            with self.lock:
+                pending, self.pending = self.pending, {}
+            for worksheet, log_name, rows in pending.values():
+                handle_log_update(
+                    worksheet.append_rows, worksheet, rows,
+                    log_name=log_name, verbose=False
+                    )
+
+
+# Log sink shared by the interactive prompts
+LOG_SINK = LogSink(LOG_FLUSH_INTERVAL)
+
+
+class SheetWriter:
+    """
+    Runs the writes of the validated data, outliers and validation logs
+    to their worksheets on a background thread, so Phase 2 starts as
+    soon as the validated data is ready in memory and the uploads
+    overlap with the user choosing their dates.
+
+    The writes run one at a time, in the order they were submitted, so
+    each worksheet is written in the same order as before. A write that
+    fails is recorded, and the rest still run. The failures are reported
+    from the main thread by report(), so they never land in the middle
+    of a prompt, and are written to the error log through LOG_SINK.
+    wait() blocks until every write submitted so far has finished, and
+    is called when the application exits.
+    """
+
+    def __init__(self):
+        self.executor = None
+        self.pending = []
+        self.errors = []
+        self.reported = 0
+        self.completed = 0
+        self.error_log = None
+        self.lock = threading.Lock()
+        os.register_at_fork(after_in_child=self.after_fork)
+
+    def after_fork(self):
+        """
+        Resets the writer in a forked process, which has no background
+        thread. Writes submitted before the fork are left to the parent.
+        """
+        self.executor = None
+        self.pending = []
+        self.errors = []
+        self.reported = 0
+        self.completed = 0
+        self.lock = threading.Lock()
+
+    def submit(self, name, function, *args, phase=None, **kwargs):
+        """
+        Queues a write to run on the background thread.
+
+        Args:
+        - name (str): What is being written, for error messages.
+        - function (function): The function that writes to the worksheet.
+        - *args, **kwargs: The arguments of the function.
+        - phase (str, optional): The profiler phase the write is timed
+          as. Defaults to None, which does not time it.
+
+        Returns:
+        - concurrent.futures.Future: The future of the write.
+        """
+        with self.lock:
+            # Start the background thread on first use
+            if self.executor is None:
+                self.executor = futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='sheet-writer'
+                    )
+                atexit.register(self.wait)
+            future = self.executor.submit(
+                self.run, name, function, phase, args, kwargs
+                )
+            self.pending.append(future)
+        return future
+
+    def run(self, name, function, phase, args, kwargs):
+        """
+        Runs one write, recording rather than raising any error.
+        """
+        try:
+            if phase is None:
+                function(*args, **kwargs)
+            else:
+                with PROFILER.phase(phase):
+                    function(*args, **kwargs)
+        except Exception as e:
+            with self.lock:
+                self.errors.append([
+                    "Sheet Write Error", str(pd.Timestamp.now()),
+                    f"Error writing {name}: {e}"
+                    ])
+            return False
+        with self.lock:
+            self.completed += 1
+        return True
+
+    def report(self):
+        """
+        Prints the writes that have failed since the last report, and
+        writes them to the error log, if one has been set.
+
+        Returns:
+        - list: The error log entries of the newly failed writes.
+        """
+        with self.lock:
+            errors = self.errors[self.reported:]
+            self.reported = len(self.errors)
+        for _, _, message in errors:
+            print(message)
+        if errors and self.error_log is not None:
+            LOG_SINK.write(self.error_log, errors, log_name='error log')
+            LOG_SINK.flush()
+        return errors
+
+    def wait(self):
+        """
+        Waits for every write submitted so far to finish, then reports
+        any that failed.
+
+        Returns:
+        - list: The error log entries of the newly failed writes.
+        """
+        with self.lock:
+            pending, self.pending = self.pending, []
+        if not all(future.done() for future in pending):
+            print("Waiting For The Sheet Writes To Finish     <<<<<\n")
+            with PROFILER.phase('background_writes'):
+                futures.wait(pending)
+            print(
+                f"Sheet Writes Finished: {self.completed} Written, "
+                f"{len(self.errors)} Failed     <<<<<\n"
+                )
+        return self.report()
+
+
+# Background writer for the worksheets written during validation
+SHEET_WRITER = SheetWriter()
+
+
+def ingest_master_data(master_data):
+    """
+    Creates the typed master data frame from the raw worksheet values.
+
+    Only the columns in MASTER_DATA_SCHEMA are kept. Each measurement
+    column is parsed to floating point once, a whole column at a time, so
+    the validation steps work on numbers rather than text. Values that
+    are empty or cannot be read as numbers become NaN, and are treated as
+    missing values.
 
     Args:
-    - worksheet (object): Google Sheets worksheet object.
+    - master_data (list): The raw master data, where the first row
+      contains the column headers.
 
     Returns:
-    - int: The index of the last filled row.
+    - pd.DataFrame: The master data with the columns and types in
+      MASTER_DATA_SCHEMA.
     """
-    sheet_data = worksheet.get_all_values()  # Get all values from the sheet
-    return len(sheet_data)  # The last filled row index is the number of rows
+    df = pd.DataFrame(master_data[1:], columns=master_data[0])
+    master_df = df[list(MASTER_DATA_SCHEMA)].copy()
+    for column in MEASUREMENT_COLUMNS:
+        master_df[column] = pd.to_numeric(
+            master_df[column], errors='coerce'
+            ).astype(MASTER_DATA_SCHEMA[column])
+
+    return master_df
+
+
+def fingerprint_rows(master_df):
+    """
+    Computes a 64-bit fingerprint of each row of the master data.
+
+    The fingerprints are hashed a whole column at a time, and two rows
+    have the same fingerprint when they have the same values, so rows can
+    be compared by a single number. They are used to find duplicate rows
+    and to find the rows that have changed since they were validated.
+
+    Args:
+    - master_df (pd.DataFrame): The typed master data, from
+      ingest_master_data.
+
+    Returns:
+    - np.ndarray: The fingerprint of each row, as unsigned 64-bit
+      integers.
+    """
+    return pd.util.hash_pandas_object(
+        master_df[list(MASTER_DATA_SCHEMA)], index=False
+        ).to_numpy()
 
 
 def validate_missing_values(master_df, session_log_data, error_log_data):
@@ -400,6 +2012,7 @@ def validate_missing_values(master_df, session_log_data, error_log_data):
     """
     # Validate for Missing Values
     print("Validating missing values started       <<<<<\n")
+    missing_values_removed_df = master_df
     session_log_data.append(['Checking For Missing Values'])
     session_log_data.append([str(pd.Timestamp.now())])
 
@@ -447,7 +2060,7 @@ def validate_missing_values(master_df, session_log_data, error_log_data):
 
 def validate_duplicates(
         missing_values_removed_df, session_log_data,
-        error_log_data
+        error_log_data, seen_rows=None, fingerprints=None
         ):
     """
     Validates the dataframe for duplicate rows and logs the process.
@@ -463,15 +2076,36 @@ def validate_duplicates(
     session_log_data (list): The list used to log session activity.
     error_log_data (list): The list used to log errors encountered
     during validation.
+    seen_rows (set, optional): The fingerprints of the rows kept by the
+    duplicate check in an earlier session. Rows matching one of them are
+    duplicates too. Defaults to None.
+    fingerprints (pandas.Series, optional): The row fingerprints from
+    fingerprint_rows, indexed like the rows they were computed from.
+    Defaults to None, which computes them here.
 
     Returns:
     pandas.DataFrame: The dataframe with duplicate rows removed.
     """
     # Check for duplicate rows
     print("Validating duplicates started       <<<<<\n")
-    duplicates_found = missing_values_removed_df.duplicated(
-        keep=False
-        ).sum()
+    # Compare rows by their fingerprints rather than their values
+    if fingerprints is None:
+        keys = pd.Series(
+            fingerprint_rows(missing_values_removed_df),
+            index=missing_values_removed_df.index
+            )
+    else:
+        keys = fingerprints.loc[missing_values_removed_df.index]
+    duplicated = keys.duplicated(keep=False).to_numpy()
+    repeated = keys.duplicated(keep='first').to_numpy()
+    seen = np.zeros(len(keys), dtype=bool)
+    if seen_rows:
+        seen = np.fromiter(
+            (key in seen_rows for key in keys.tolist()),
+            dtype=bool, count=len(keys)
+            )
+        duplicated = duplicated | seen
+    duplicates_found = duplicated.sum()
 
     if duplicates_found:
         print(
@@ -484,8 +2118,7 @@ def validate_duplicates(
             )
         session_log_data.append([str(pd.Timestamp.now())])
         error_log_data.append(['Duplicate Rows Found'])
-        duplicates_df = missing_values_removed_df[
-            missing_values_removed_df.duplicated(keep=False)]
+        duplicates_df = missing_values_removed_df[duplicated]
 
         # Format duplicates_df for column-wise insertion
         duplicates_list_of_lists = duplicates_df.values.tolist()
@@ -496,13 +2129,11 @@ def validate_duplicates(
         # Append to the error log data
         error_log_data.append(['Duplicate Rows Data'])
         error_log_data.extend(formatted_duplicates)
-        missing_values_removed_df = missing_values_removed_df.drop_duplicates(
-            keep='first'
-            )
+        missing_values_removed_df = missing_values_removed_df[
+            ~(repeated | seen)]
         print("     Duplicates have been removed\n")
     else:
         print("     No duplicates found in the working data set.\n")
-        no_duplicates_df = missing_values_removed_df
 
     print("Validating duplicates completed     <<<<<\n\n\n")
 
@@ -514,7 +2145,8 @@ def validate_outliers(
         atmos_outlier_log, atmos_outliers_url,
         wind_outlier_log, wind_outliers_url,
         wave_outlier_log, wave_outliers_url,
-        temp_outlier_log, temp_outliers_url
+        temp_outlier_log, temp_outliers_url,
+        outlier_detectors=None
         ):
     """
     Validates the dataframe for outliers and logs the process across various
@@ -542,36 +2174,82 @@ def validate_outliers(
     temp_outlier_log (gspread.models.Worksheet): The Google Sheet
     worksheet for temperature outliers.
     temp_outliers_url (str): The URL link to the temperature outliers log.
+    outlier_detectors (dict, optional): The OutlierDetector of each group
+    of measurements, keyed like the returned outliers. Detectors from an
+    earlier session only score the rows added since, and are updated in
+    place. Defaults to None, which scores every row.
 
     Returns:
-    None: This function logs the detected outliers and updates the
-    corresponding Google Sheets
-    but does not return any value.
+    dict: The outlier dataframes keyed by 'atmos', 'wind', 'wave' and
+    'temp'. The detected outliers are also written to the corresponding
+    Google Sheets.
     """
     # Check for outliers
     print("Outlier Validation Started       <<<<<\n")
     session_log_data.append(['Outlier Validation Started'])
     session_log_data.append([str(pd.Timestamp.now())])
 
-    numeric_df = no_duplicates_df.apply(
-        lambda col: col.map(lambda x: pd.to_numeric(x, errors='coerce'))
-        )
+    numeric_df = no_duplicates_df[MEASUREMENT_COLUMNS]
+    if outlier_detectors is None:
+        outlier_detectors = {}
+
+    outlier_groups = {
+        'atmos': ['AtmosphericPressure'],
+        'wind': ['WindSpeed', 'Gust'],
+        'wave': ['WaveHeight', 'WavePeriod', 'MeanWaveDirection'],
+        'temp': ['AirTemperature', 'SeaTemperature']
+        }
+
+    outliers = {}
+    for group, columns in outlier_groups.items():
+        # Start again if the detector has seen rows that are gone or
+        # was scoring in a different way
+        detector = outlier_detectors.get(group)
+        if detector is None or detector.count > len(numeric_df) or (
+                detector.threshold != OUTLIER_THRESHOLD or
+                detector.window != OUTLIER_WINDOW):
+            detector = OutlierDetector(OUTLIER_THRESHOLD, OUTLIER_WINDOW)
+            outlier_detectors[group] = detector
+        outliers[group] = check_for_outliers(numeric_df[columns], detector)
 
-    atmospheric_outliers = check_for_outliers(
-        numeric_df[['AtmosphericPressure']]
-        )
-    wind_outliers = check_for_outliers(numeric_df[['WindSpeed', 'Gust']])
-    wave_outliers = check_for_outliers(
-        numeric_df[['WaveHeight', 'WavePeriod', 'MeanWaveDirection']]
-        )
-    temp_outliers = check_for_outliers(
-        numeric_df[['AirTemperature', 'SeaTemperature']]
+    # Update Outlier Sheets
+    write_outlier_logs(
+        outliers,
+        atmos_outlier_log, atmos_outliers_url,
+        wind_outlier_log, wind_outliers_url,
+        wave_outlier_log, wave_outliers_url,
+        temp_outlier_log, temp_outliers_url
         )
 
-    # Update Outlier Sheets
-    if not atmospheric_outliers.empty:
-        atmos_outlier_log.update(
-            df_to_list_of_lists(atmospheric_outliers), 'A1'
+    print("Outlier Validation Completed     <<<<<\n\n\n")
+
+    return outliers
+
+
+def write_outlier_logs(
+        outliers,
+        atmos_outlier_log, atmos_outliers_url,
+        wind_outlier_log, wind_outliers_url,
+        wave_outlier_log, wave_outliers_url,
+        temp_outlier_log, temp_outliers_url
+        ):
+    """
+    Writes the outliers found for each group of measurements to their
+    outlier log worksheets. The writes are queued on SHEET_WRITER, so
+    they run in the background.
+
+    Args:
+    - outliers (dict): The outlier dataframes keyed by 'atmos', 'wind',
+      'wave' and 'temp'.
+    - atmos_outlier_log, wind_outlier_log, wave_outlier_log,
+      temp_outlier_log (gspread.models.Worksheet): The outlier worksheets.
+    - atmos_outliers_url, wind_outliers_url, wave_outliers_url,
+      temp_outliers_url (str): The URL links to the outlier worksheets.
+    """
+    if not outliers['atmos'].empty:
+        SHEET_WRITER.submit(
+            'atmos outlier log', atmos_outlier_log.update,
+            df_to_list_of_lists(outliers['atmos']), 'A1'
             )
         print(
             "     Atmospheric Outliers Were Found:"
@@ -581,15 +2259,21 @@ def validate_outliers(
             f"    \nThe link to the Atmospheric Outliers log is: \n\
             \n{atmos_outliers_url}\n\n"
             )
-    if not wind_outliers.empty:
-        wind_outlier_log.update(df_to_list_of_lists(wind_outliers), 'A1')
+    if not outliers['wind'].empty:
+        SHEET_WRITER.submit(
+            'wind outlier log', wind_outlier_log.update,
+            df_to_list_of_lists(outliers['wind']), 'A1'
+            )
         print("     Wind Outliers Were Found: Check Atmos Outlier Log")
         print(
             f"    \nThe link to the Wind Outliers log is:\n\n"
             f"{wind_outliers_url}\n\n"
             )
-    if not wave_outliers.empty:
-        wave_outlier_log.update(df_to_list_of_lists(wave_outliers), 'A1')
+    if not outliers['wave'].empty:
+        SHEET_WRITER.submit(
+            'wave outlier log', wave_outlier_log.update,
+            df_to_list_of_lists(outliers['wave']), 'A1'
+            )
         print(
             "     Wave Outliers Were Found:        Check Wave Outlier Log"
             )
@@ -597,8 +2281,11 @@ def validate_outliers(
             f"    \nThe link to the Wave Outliers log is:\n\n"
             f"{wave_outliers_url}\n\n"
             )
-    if not temp_outliers.empty:
-        temp_outlier_log.update(df_to_list_of_lists(temp_outliers), 'A1')
+    if not outliers['temp'].empty:
+        SHEET_WRITER.submit(
+            'temp outlier log', temp_outlier_log.update,
+            df_to_list_of_lists(outliers['temp']), 'A1'
+            )
         print(
             "     Temp Outliers Were Found:        Check Temp  Outlier "
             "Log\n"
@@ -608,8 +2295,6 @@ def validate_outliers(
             f"{temp_outliers_url}\n\n"
             )
 
-    print("Outlier Validation Completed     <<<<<\n\n\n")
-
 
 def validate_date_format(
         master_df, session_log_data, error_log_data, date_time_url
@@ -700,9 +2385,9 @@ def update_all_logs(
 
     This function converts session logs, error logs, and date-time
     error logs from lists to a format suitable for Google Sheets,
-    then updates the respective sheets with this data.
-    It uses a helper function to handle the updates, ensuring each
-    log is recorded accurately.
+    then queues the appends to the respective sheets on SHEET_WRITER,
+    so the logs are written in the background while the session goes
+    on. Any write that fails is reported by SHEET_WRITER.
 
     Args:
     session_log_data (list): The list containing session log entries.
@@ -717,46 +2402,231 @@ def update_all_logs(
     worksheet for the date-time error log.
 
     Returns:
-    None: This function updates the Google Sheets logs and does
-    not return any value.
+    None: This function updates the Google Sheets logs and does
+    not return any value.
+    """
+    # Convert log lists to strings and append them to Google Sheets in
+    # the background
+    SHEET_WRITER.submit(
+        'session log', session_log.append_rows,
+        df_to_list_of_lists(pd.DataFrame(session_log_data)),
+        table_range='A1'
+        )
+    SHEET_WRITER.submit(
+        'error log', error_log.append_rows,
+        df_to_list_of_lists(pd.DataFrame(error_log_data)),
+        table_range='A1'
+        )
+    SHEET_WRITER.submit(
+        'date time log', date_time_error_log.append_rows,
+        df_to_list_of_lists(pd.DataFrame(date_time_error_log_data)),
+        table_range='A1'
+        )
+
+
+def df_to_list_of_lists(df):
+    """
+    Function to convert dataframe into list of lists.
+    This is used by the outlier functions and the updater log functions
+    to write the dataframes to the respective google sheet
+    """
+    return [df.columns.tolist()] + df.values.tolist()
+
+
+def missing_values_stage(df, context):
+    """
+    Validation stage removing rows with missing values, using
+    validate_missing_values.
+    """
+    return validate_missing_values(
+        df, context['session_log_data'], context['error_log_data']
+        )
+
+
+def duplicates_stage(df, context):
+    """
+    Validation stage removing duplicate rows, using validate_duplicates.
+    New rows that duplicate rows validated in an earlier session are
+    removed too.
+    """
+    df = validate_duplicates(
+        df, context['session_log_data'], context['error_log_data'],
+        context['validation_state']['row_keys'], context['fingerprints']
+        )
+    context['unique_index'] = df.index
+    return df
+
+
+def outliers_stage(df, context):
+    """
+    Validation stage finding outliers, using validate_outliers. The rows
+    are checked together with the rows checked in an earlier session,
+    and none are removed.
+    """
+    validation_state = context['validation_state']
+    checked_df = df
+    if len(validation_state['outcomes']):
+        checked_df = pd.concat([validation_state['checked'], df])
+    context['checked_df'] = checked_df
+    context['outliers'] = validate_outliers(
+        checked_df, context['session_log_data'],
+        *context['outlier_logs'], context['outlier_detectors']
+        )
+    return df
+
+
+def date_format_stage(df, context):
+    """
+    Validation stage removing rows with an invalid date and time, using
+    validate_date_format.
+    """
+    df, context['date_time_error_log_data'] = validate_date_format(
+        df, context['session_log_data'], context['error_log_data'],
+        context['date_time_url']
+        )
+    return df
+
+
+# Validation stages by name. Each stage takes the rows still valid and
+# the validation context, and returns the rows that pass. Further checks
+# are added here and named in VALIDATION_STAGE_ORDER.
+VALIDATION_STAGES = {
+    'missing_values': missing_values_stage,
+    'duplicates': duplicates_stage,
+    'outliers': outliers_stage,
+    'date_format': date_format_stage
+    }
+
+
+def check_validation_stages(stage_names):
+    """
+    Checks a list of validation stages can be run.
+
+    Args:
+    - stage_names (list of str): The stages to run, in order.
+
+    Raises:
+    - ValueError: If a stage is unknown or a required stage is left out.
+    """
+    unknown = [name for name in stage_names if name not in VALIDATION_STAGES]
+    if unknown:
+        raise ValueError(
+            f"Unknown validation stages: {', '.join(unknown)}"
+            )
+    missing = [
+        name for name in REQUIRED_VALIDATION_STAGES
+        if name not in stage_names
+        ]
+    if missing:
+        raise ValueError(
+            f"The validation stages must include {', '.join(missing)}"
+            )
+
+
+def run_validation_stages(master_df, context, stage_names=None):
+    """
+    Runs the master data through the validation stages in order, timing
+    each one.
+
+    For each stage a timing record is kept with the rows in and out, the
+    wall time and the peak memory allocated while it ran. Peak memory is
+    measured with tracemalloc when TRACE_STAGE_MEMORY is set or memory
+    is already being traced, and is None otherwise.
+
+    Args:
+    - master_df (pd.DataFrame): The rows to validate.
+    - context (dict): The logs, worksheets and state shared by the
+      stages. Stages also leave their results in it.
+    - stage_names (list of str, optional): The stages to run, in order.
+      Defaults to None, which runs VALIDATION_STAGE_ORDER.
+
+    Returns:
+    - tuple: The rows that passed every stage, the list of timing
+      records, and a dict of the index of the rows removed by each stage.
+
+    Raises:
+    - ValueError: If the stages cannot be run, see check_validation_stages.
     """
-    # Convert log lists to strings and update Google Sheets
-    handle_log_update(
-        session_log.update, session_log,
-        df_to_list_of_lists(pd.DataFrame(session_log_data)),
-        log_name='session log'
-        )
-    handle_log_update(
-        error_log.update, error_log,
-        df_to_list_of_lists(pd.DataFrame(error_log_data)),
-        log_name='error log'
-        )
-    handle_log_update(
-        date_time_error_log.update,
-        date_time_error_log,
-        df_to_list_of_lists(pd.DataFrame(date_time_error_log_data)),
-        log_name='date time log'
-        )
+    if stage_names is None:
+        stage_names = VALIDATION_STAGE_ORDER
+    check_validation_stages(stage_names)
 
+    stage_timings = []
+    removed = {}
+    tracing = tracemalloc.is_tracing()
+    trace_memory = tracing or TRACE_STAGE_MEMORY
+    if trace_memory and not tracing:
+        tracemalloc.start()
 
-def df_to_list_of_lists(df):
+    try:
+        df = master_df
+        for stage_name in stage_names:
+            stage = VALIDATION_STAGES[stage_name]
+            rows_in = len(df)
+            peak_memory = None
+            if trace_memory:
+                tracemalloc.reset_peak()
+                memory_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            result = stage(df, context)
+            wall_time = time.perf_counter() - start
+            if trace_memory:
+                peak_memory = (
+                    tracemalloc.get_traced_memory()[1] - memory_before
+                    )
+
+            removed[stage_name] = df.index.difference(result.index)
+            df = result
+            stage_timings.append({
+                'stage': stage_name,
+                'rows_in': rows_in,
+                'rows_out': len(df),
+                'wall_time': wall_time,
+                'peak_memory': peak_memory
+                })
+    finally:
+        if trace_memory and not tracing:
+            tracemalloc.stop()
+
+    return df, stage_timings, removed
+
+
+def log_stage_timings(stage_timings, session_log_data):
     """
-    Function to convert dataframe into list of lists.
-    This is used by the outlier functions and the updater log functions
-    to write the dataframes to the respective google sheet
+    Prints the validation stage timings and adds them to the session log.
+
+    Args:
+    - stage_timings (list of dict): The timing records from
+      run_validation_stages.
+    - session_log_data (list): The list used to log session activity.
     """
-    return [df.columns.tolist()] + df.values.tolist()
+    header = ['Stage', 'Rows In', 'Rows Out', 'Wall Time (s)',
+              'Peak Memory (MB)']
+    rows = [
+        [timing['stage'], timing['rows_in'], timing['rows_out'],
+         f"{timing['wall_time']:.3f}",
+         '-' if timing['peak_memory'] is None
+         else f"{timing['peak_memory'] / 2 ** 20:.1f}"]
+        for timing in stage_timings
+        ]
+
+    print("Validation Stage Timings\n")
+    print(pd.DataFrame(rows, columns=header).to_string(index=False))
+    print("\n")
+    session_log_data.append(['Validation Stage Timings'])
+    session_log_data.append(header)
+    session_log_data.extend(rows)
 
 
 def validate_master_data(
-        master_data, session_log_data, error_log_data,
+        storage, master_data, session_log_data, error_log_data,
         session_log, error_log, date_time_error_log,
         validated_master_data, validated_master_data_url,
         atmos_outlier_log, atmos_outliers_url,
         wind_outlier_log, wind_outliers_url,
         wave_outlier_log, wave_outliers_url,
         temp_outlier_log, temp_outliers_url,
-        date_time_url
+        date_time_url, outlier_detectors=None, validation_state=None
         ):
     """
     Validates and cleans a marine data set through several checks
@@ -787,11 +2657,24 @@ def validate_master_data(
        - Logs any rows with date format inconsistencies and attempts
         corrections.
 
+    The checks are the validation stages named in VALIDATION_STAGE_ORDER,
+    run in that order by run_validation_stages.
+
+    When a validation state from an earlier session is given, the source
+    rows it has already validated are skipped. Only the rows after them
+    go through the checks, and the results are merged with the rows
+    validated before, giving the same validated data as checking every
+    row. The error and date-time logs are then built again from the
+    outcome of every row, so they also list what was found in the rows
+    validated before.
+
     After the validations, the function updates session logs, error logs,
     and date-time logs in Google Sheets, and writes the cleaned, validated
     data back to a specified Google Sheet.
 
     Args:
+    - storage (GoogleSheetsBackend or LocalBackend): The storage backend
+      the worksheets belong to.
     - master_data (list): The input dataset where the first
     row contains column headers.
     - session_log_data (list): A list to accumulate entries
@@ -822,53 +2705,91 @@ def validate_master_data(
     - temp_outliers_url (str): The URL of the Google Sheet for temperature
       outliers.
     - date_time_url (str): The URL of the Google Sheet for date-time errors.
+    - outlier_detectors (dict, optional): The outlier detectors from an
+      earlier session, passed to validate_outliers. Defaults to None.
+    - validation_state (dict, optional): The state returned by
+      new_validation_state, updated in place with the rows validated in
+      this session. Defaults to None, which validates every row.
 
     Returns:
-    - pd.DataFrame: The cleaned and validated master data as a
-      pandas DataFrame.
+    - tuple: A tuple containing the cleaned and validated master data as a
+      pandas DataFrame, and a dict of the session, error, date-time and
+      outlier logs and the stage timings produced by the validation.
     """
     # Initialise log lists
     date_time_error_log_data = []  # Initialize date_time_error_log_data here
+    outliers = {}
+    stage_timings = []
     print("\n\n >>>>> Validate Master Data <<<<<\n\n\n")
     print("\nData Validation Started       <<<<<\n\n\n")
     validated_data_df = pd.DataFrame()
+    if validation_state is None:
+        validation_state = new_validation_state()
 
     # Write a heading to the error log in google sheets with time/date stamp
     try:
-        # Create dataframe to work with
-        df = pd.DataFrame(master_data[1:], columns=master_data[0])
-
-        # pick out the specific columns to be used in the application and
-        # create a master data frame
-        master_df = df[['time', 'AtmosphericPressure', 'WindDirection',
-                        'WindSpeed', 'Gust', 'WaveHeight', 'WavePeriod',
-                        'MeanWaveDirection', 'AirTemperature',
-                        'SeaTemperature', 'RelativeHumidity']]
+        # Create a typed master data frame with the columns used in the
+        # application, from the source rows not validated before. The
+        # index is the position of each row in the source data.
+        done = len(validation_state['outcomes'])
+        master_df = ingest_master_data(
+            [master_data[0]] + master_data[1 + done:]
+            )
+        master_df.index = master_df.index + done
+        new_master_df = master_df
+        fingerprints = pd.Series(
+            fingerprint_rows(master_df), index=master_df.index
+            )
 
         session_log_data.append(['Data Validation Started <<<<<<<<<<'])
         session_log_data.append([str(pd.Timestamp.now())])
-        # validate data for missing values - output clean dataframe
-        master_df = validate_missing_values(
-            master_df, session_log_data,
-            error_log_data
-            )
-        # validate data for duplicate and remove - output clean dataframe
-        master_df = validate_duplicates(
-            master_df, session_log_data,
-            error_log_data
-            )
-        # check data for outliers and output to sheets if found
-        validate_outliers(
-            master_df, session_log_data,
-            atmos_outlier_log, atmos_outliers_url,
-            wind_outlier_log, wind_outliers_url,
-            wave_outlier_log, wave_outliers_url,
-            temp_outlier_log, temp_outliers_url
+        error_log_start = len(error_log_data)
+        if done:
+            print(f"     {done} rows were validated in an earlier session")
+            print(f"     Validating {len(master_df)} new rows\n")
+            session_log_data.append(
+                [f'Rows Validated In An Earlier Session: {done}']
+                )
+        # Run the new rows through each validation stage in turn
+        context = {
+            'session_log_data': session_log_data,
+            'error_log_data': error_log_data,
+            'validation_state': validation_state,
+            'fingerprints': fingerprints,
+            'outlier_detectors': outlier_detectors,
+            'outlier_logs': (
+                atmos_outlier_log, atmos_outliers_url,
+                wind_outlier_log, wind_outliers_url,
+                wave_outlier_log, wave_outliers_url,
+                temp_outlier_log, temp_outliers_url
+                ),
+            'date_time_url': date_time_url,
+            'outliers': {},
+            'date_time_error_log_data': [],
+            'checked_df': None,
+            'unique_index': master_df.index[:0]
+            }
+        validated_data_df, stage_timings, removed = run_validation_stages(
+            master_df, context
             )
-        # validate data after date format errors and remove
-        validated_data_df, date_time_error_log_data = validate_date_format(
-            master_df, session_log_data, error_log_data, date_time_url
+        outliers = context['outliers']
+        date_time_error_log_data = context['date_time_error_log_data']
+        log_stage_timings(stage_timings, session_log_data)
+
+        # Merge the new rows with the rows validated before, and
+        # remember the outcome of every source row checked
+        update_validation_state(
+            validation_state, fingerprints, removed, validated_data_df,
+            context['checked_df'], context['unique_index']
             )
+        validated_data_df = validation_state['validated']
+        if done:
+            date_time_error_log_data = build_date_time_error_log(
+                master_data, validation_state['outcomes']
+                )
+            error_log_data[error_log_start:] = build_validation_error_log(
+                master_data, validation_state
+                )
 
         print("Date Validation Completed     <<<<<\n")
         session_log_data.append(['Data Validation Ended <<<<<<<<<<'])
@@ -897,9 +2818,11 @@ def validate_master_data(
             )
 
     print("\n\n\n >>>>> Master Data Validation Completed <<<<<\n\n\n")
-    print("Writing Validated Data To Google Sheets Started      <<<<<\n")
-    set_with_dataframe(validated_master_data, validated_data_df)
-    print("Writing Validated Data To Google Sheets Completed    <<<<<\n")
+    print("Writing Validated Data To Google Sheets In The Background <<<<<\n")
+    SHEET_WRITER.submit(
+        'validated master data', storage.write_dataframe,
+        validated_master_data, validated_data_df, phase='validated_upload'
+        )
     print(
         f"    \nThe validated master data is written here:\n\n"
         f"{validated_master_data_url}\n\n"
@@ -910,7 +2833,426 @@ def validate_master_data(
     print("#############################################################")
     print("\n")
 
-    return validated_data_df
+    # Keep the logs so they can be replayed from the local snapshot
+    validation_logs = {
+        'session_log': session_log_data,
+        'error_log': error_log_data,
+        'date_time_error_log': date_time_error_log_data,
+        'outliers': outliers,
+        'stage_timings': stage_timings
+        }
+
+    return validated_data_df, validation_logs
+
+
+def new_validation_state():
+    """
+    Creates an empty validation state, for a session where every row of
+    the master data is validated.
+
+    The state records what has been validated so far, so the next session
+    only has to validate the rows added since:
+    - stages: the validation stages run, in order. The state only holds
+      while the same stages are run.
+    - outcomes: the outcome of each source row in order, either 'valid'
+      or the name of the validation stage that removed it.
+    - fingerprints: the fingerprint of each source row in order, used to
+      find the rows changed since they were validated.
+    - checked: the rows kept by the missing value and duplicate checks,
+      which are the rows checked for outliers.
+    - row_keys: the fingerprints of the rows kept by the duplicate
+      check, used to find new rows that duplicate them.
+    - validated: the validated rows.
+
+    Returns:
+    - dict: The empty validation state.
+    """
+    return {
+        'stages': list(VALIDATION_STAGE_ORDER),
+        'outcomes': np.array([], dtype=object),
+        'fingerprints': np.array([], dtype=np.uint64),
+        'checked': pd.DataFrame(),
+        'row_keys': set(),
+        'validated': pd.DataFrame()
+        }
+
+
+def update_validation_state(
+        validation_state, new_fingerprints, removed, new_validated_df,
+        checked_df, unique_index
+        ):
+    """
+    Records the outcome of the source rows validated in this session.
+
+    Args:
+    - validation_state (dict): The state to update in place.
+    - new_fingerprints (pd.Series): The fingerprints of the new rows,
+      indexed by their position in the source data.
+    - removed (dict): The index of the new rows removed by each
+      validation stage, keyed by stage name.
+    - new_validated_df (pd.DataFrame): The new rows that passed every
+      check, added to the validated rows of the state.
+    - checked_df (pd.DataFrame): All the rows checked for outliers, old
+      and new, or None if the outliers stage was not run.
+    - unique_index (pd.Index): The index of the new rows kept by the
+      duplicate check.
+    """
+    done = len(validation_state['outcomes'])
+    outcomes = np.full(len(new_fingerprints), 'valid', dtype=object)
+    for stage_name, index in removed.items():
+        outcomes[index - done] = stage_name
+
+    validation_state['outcomes'] = np.concatenate(
+        [validation_state['outcomes'], outcomes]
+        )
+    validation_state['fingerprints'] = np.concatenate(
+        [validation_state['fingerprints'], new_fingerprints.to_numpy()]
+        )
+    if checked_df is not None:
+        validation_state['checked'] = checked_df
+    validation_state['row_keys'].update(
+        new_fingerprints.loc[unique_index].tolist()
+        )
+    if done:
+        new_validated_df = pd.concat(
+            [validation_state['validated'], new_validated_df]
+            )
+    validation_state['validated'] = new_validated_df
+
+
+def rewind_validation_state(validation_state, master_data):
+    """
+    Keeps the part of a validation state that still holds after the
+    master data has been edited.
+
+    The fingerprints of the source rows are compared with those recorded
+    when they were validated. The rows before the first one that differs
+    are unchanged, so their outcomes are kept and only the rows from
+    there on need to be validated again.
+
+    Args:
+    - validation_state (dict): The state from an earlier session.
+    - master_data (list): The raw master data, where the first row
+      contains the column headers.
+
+    Returns:
+    - dict: The validation state of the unchanged leading rows.
+    """
+    previous = validation_state['fingerprints']
+    current = fingerprint_rows(ingest_master_data(master_data))
+    overlap = min(len(previous), len(current))
+    changed = np.flatnonzero(previous[:overlap] != current[:overlap])
+    unchanged = changed[0] if len(changed) else overlap
+
+    checked = validation_state['checked']
+    if not checked.empty:
+        checked = checked[checked.index < unchanged]
+    # Rows kept by the duplicate check are those not removed by it or by
+    # an earlier stage
+    stages = validation_state['stages']
+    outcomes = validation_state['outcomes'][:unchanged]
+    row_keys = np.ones(unchanged, dtype=bool)
+    if 'duplicates' in stages:
+        earlier = stages[:stages.index('duplicates') + 1]
+        row_keys = ~np.isin(outcomes, earlier)
+    validated = validation_state['validated']
+    if not validated.empty:
+        validated = validated[validated.index < unchanged]
+
+    return {
+        'stages': validation_state['stages'],
+        'outcomes': validation_state['outcomes'][:unchanged],
+        'fingerprints': previous[:unchanged],
+        'checked': checked,
+        'row_keys': set(previous[:unchanged][row_keys].tolist()),
+        'validated': validated
+        }
+
+
+def build_date_time_error_log(master_data, outcomes):
+    """
+    Lists the times of every source row removed for an invalid date and
+    time format, including rows validated in an earlier session.
+
+    Args:
+    - master_data (list): The raw master data, where the first row
+      contains the column headers.
+    - outcomes (np.ndarray): The outcome of each source row.
+
+    Returns:
+    - list: The date-time error log entries, in the form written by
+      validate_date_format.
+    """
+    invalid_rows = np.flatnonzero(outcomes == 'date_format')
+    if not len(invalid_rows):
+        return []
+
+    time_column = master_data[0].index('time')
+    return [
+        ['Inconsistent Date and Time Formats'],
+        [str(master_data[1 + row][time_column]) for row in invalid_rows]
+        ]
+
+
+def build_validation_error_log(master_data, validation_state):
+    """
+    Lists the missing values and duplicate rows found in every source
+    row, including rows validated in an earlier session, so the error
+    log of an incremental validation is the same as that of a full one.
+
+    Only the rows the missing value and duplicate checks found are read
+    again. The entries are in the form written by
+    validate_missing_values and validate_duplicates, in stage order.
+
+    Args:
+    - master_data (list): The raw master data, where the first row
+      contains the column headers.
+    - validation_state (dict): The state holding the outcome and
+      fingerprint of every source row.
+
+    Returns:
+    - list: The error log entries of the missing value and duplicate
+      checks.
+    """
+    stages = validation_state['stages']
+    outcomes = validation_state['outcomes']
+    fingerprints = validation_state['fingerprints']
+
+    def ingest_rows(rows):
+        return ingest_master_data(
+            [master_data[0]] + [master_data[1 + row] for row in rows]
+            )
+
+    error_log_data = []
+    for stage_name in stages:
+        if stage_name == 'missing_values':
+            rows = np.flatnonzero(outcomes == 'missing_values')
+            if not len(rows):
+                continue
+            missing_values = ingest_rows(rows).replace(
+                to_replace=['nan', 'NaN', ''], value=np.nan
+                ).isnull().sum()
+            error_log_data.append(['Missing Values       <<<<<'])
+            for column, count in missing_values.items():
+                if count > 0:
+                    error_log_data.append(
+                        [f"{column}: {count} missing values"]
+                        )
+        elif stage_name == 'duplicates':
+            # Every copy of a removed row is listed, including the copy
+            # that was kept
+            repeated_keys = fingerprints[outcomes == 'duplicates']
+            if not len(repeated_keys):
+                continue
+            checked = ~np.isin(
+                outcomes, stages[:stages.index('duplicates')]
+                )
+            duplicates_df = ingest_rows(np.flatnonzero(
+                checked & np.isin(fingerprints, repeated_keys)
+                ))
+            error_log_data.append(['Duplicate Rows Found'])
+            error_log_data.append(['Duplicate Rows Data'])
+            error_log_data.append(duplicates_df.columns.tolist())
+            error_log_data.extend(duplicates_df.values.tolist())
+    return error_log_data
+
+
+def aggregate_by_day(validated_df):
+    """
+    Summarises the validated data for each day.
+
+    For every measurement column the count, minimum, maximum, sum and
+    sum of squares are kept. These can be combined across days, weeks
+    and months without going back to the hourly rows, and give the mean
+    and standard deviation of any combination.
+
+    Args:
+    - validated_df (pd.DataFrame): The validated data, with the time
+      column in the format '%d-%m-%YT%H:%M:%S'.
+
+    Returns:
+    - pd.DataFrame: One row per day, indexed by date, with columns
+      indexed by statistic and then measurement column.
+    """
+    days = pd.to_datetime(
+        validated_df['time'], format='%d-%m-%YT%H:%M:%S'
+        ).dt.normalize().values
+    values = validated_df[MEASUREMENT_COLUMNS]
+    grouped = values.groupby(days)
+    return pd.concat({
+        'count': grouped.count(),
+        'min': grouped.min(),
+        'max': grouped.max(),
+        'sum': grouped.sum(),
+        'sumsq': (values ** 2).groupby(days).sum()
+        }, axis=1)
+
+
+def combine_aggregates(aggregates, keys):
+    """
+    Combines rows of aggregates that share a key, such as the days of
+    a week.
+
+    Args:
+    - aggregates (pd.DataFrame): Aggregates returned by aggregate_by_day,
+      or combined from them.
+    - keys (array-like): The key of each row to combine on.
+
+    Returns:
+    - pd.DataFrame: One row of aggregates per key.
+    """
+    grouped = aggregates.groupby(keys)
+    totals = grouped.sum()
+    return pd.concat({
+        'count': totals['count'],
+        'min': grouped.min()['min'],
+        'max': grouped.max()['max'],
+        'sum': totals['sum'],
+        'sumsq': totals['sumsq']
+        }, axis=1)
+
+
+def build_aggregate_cube(daily):
+    """
+    Builds the aggregate cube from the daily aggregates, rolling them up
+    to weeks, starting on Monday, and to calendar months.
+
+    Args:
+    - daily (pd.DataFrame): The daily aggregates.
+
+    Returns:
+    - dict: The 'day', 'week' and 'month' aggregates, and 'last_time',
+      the last day included.
+    """
+    return {
+        'day': daily,
+        'week': combine_aggregates(
+            daily, daily.index.to_period('W').start_time
+            ),
+        'month': combine_aggregates(
+            daily, daily.index.to_period('M').start_time
+            ),
+        'last_time': daily.index.max()
+        }
+
+
+def update_aggregate_cube(aggregate_cube, validated_df):
+    """
+    Builds the aggregate cube of the validated data, or brings an
+    existing cube up to date.
+
+    When an existing cube is given, only the rows from its last day
+    onwards are aggregated and merged into it. The cube is rebuilt from
+    all rows if it no longer matches the data before its last day, for
+    example when rows were removed by validation.
+
+    Args:
+    - aggregate_cube (dict): The cube from an earlier session, or None.
+    - validated_df (pd.DataFrame): The validated data.
+
+    Returns:
+    - dict: The up to date aggregate cube.
+    """
+    if validated_df.empty:
+        return aggregate_cube
+
+    if aggregate_cube is not None:
+        days = pd.to_datetime(
+            validated_df['time'], format='%d-%m-%YT%H:%M:%S'
+            ).dt.normalize()
+        daily = aggregate_cube['day']
+        last_time = aggregate_cube['last_time']
+        settled = daily.loc[daily.index < last_time, 'count']
+        # The rows before the last day must be exactly those already
+        # counted in the cube, the last day may have gained new hours
+        if (days < last_time).sum() == settled.iloc[:, 0].sum():
+            new_daily = aggregate_by_day(validated_df[days >= last_time])
+            daily = pd.concat([daily[daily.index < last_time], new_daily])
+            return build_aggregate_cube(daily)
+
+    return build_aggregate_cube(aggregate_by_day(validated_df))
+
+
+def summarise_date_range(aggregate_cube, start_date, end_date):
+    """
+    Summarises the measurements between two dates, inclusive, from the
+    aggregate cube.
+
+    Whole months in the range are read from the monthly aggregates and
+    only the days at either end from the daily aggregates, so a range of
+    several years is answered from a few dozen rows of the cube.
+
+    Args:
+    - aggregate_cube (dict): The aggregate cube of the validated data.
+    - start_date (str): The start date in the format 'dd-mm-yyyy'.
+    - end_date (str): The end date in the format 'dd-mm-yyyy'.
+
+    Returns:
+    - pd.DataFrame: The count, min, mean, max and standard deviation of
+      each measurement column.
+    """
+    start_date = pd.to_datetime(start_date, format='%d-%m-%Y')
+    end_date = pd.to_datetime(end_date, format='%d-%m-%Y')
+
+    # Whole months within the range
+    first_month = (start_date - pd.Timedelta(days=1)).to_period('M') + 1
+    last_month = (end_date + pd.Timedelta(days=1)).to_period('M') - 1
+    months = aggregate_cube['month']
+    months = months[
+        (months.index >= first_month.start_time) &
+        (months.index <= last_month.start_time)
+        ]
+
+    # Days before and after the whole months
+    days = aggregate_cube['day']
+    days = days[
+        (days.index >= start_date) & (days.index <= end_date) &
+        ((days.index < first_month.start_time) |
+         (days.index > last_month.end_time))
+        ]
+
+    totals = combine_aggregates(
+        pd.concat([months, days]), np.zeros(len(months) + len(days))
+        )
+    if totals.empty:
+        return pd.DataFrame(columns=MEASUREMENT_COLUMNS)
+
+    totals = totals.iloc[0].unstack()
+    mean = totals.loc['sum'] / totals.loc['count']
+    variance = (totals.loc['sumsq'] / totals.loc['count'] - mean ** 2)
+    return pd.DataFrame({
+        'count': totals.loc['count'],
+        'min': totals.loc['min'],
+        'mean': mean,
+        'max': totals.loc['max'],
+        'std': np.sqrt(variance.clip(lower=0))
+        }).T[MEASUREMENT_COLUMNS]
+
+
+def print_date_range_summary(
+        aggregate_cube, start_date, end_date, selected_columns
+        ):
+    """
+    Prints a summary of the selected measurement columns between two
+    dates, read from the aggregate cube.
+
+    Args:
+    - aggregate_cube (dict): The aggregate cube of the validated data.
+    - start_date (str): The start date in the format 'dd-mm-yyyy'.
+    - end_date (str): The end date in the format 'dd-mm-yyyy'.
+    - selected_columns (list of str): The columns selected by the user.
+    """
+    if aggregate_cube is None:
+        return
+
+    columns = [col for col in selected_columns if col in MEASUREMENT_COLUMNS]
+    summary = summarise_date_range(aggregate_cube, start_date, end_date)
+    if summary.empty or not columns:
+        return
+
+    print(f"Summary from {start_date} to {end_date}:\n")
+    print(summary[columns].round(2).to_string())
+    print("\n")
 
 
 def format_df_date(validated_df):
@@ -919,15 +3261,24 @@ def format_df_date(validated_df):
     from yyyy-mm-dd to dd-mm-yyyy
     as this is the format the user will input as their
     reqesed date range
+
+    The time column is parsed once here and the data is sorted on a
+    datetime index built from it, so date range lookups can use a binary
+    search instead of parsing the dates again.
+
+    Returns:
+    - pd.DataFrame: The validated data, with the time column as datetimes
+      and sorted on a datetime index.
     """
-    # convert the time columnin df to just date for comparison drop h:m:s
+    # convert the time column in df to datetime, once, for all lookups
+    validated_df = validated_df.copy()
     validated_df['time'] = pd.to_datetime(
         validated_df['time'],
-        format='%d-%m-%YT%H:%M:%S',
-        errors='coerce', dayfirst=True
+        format='%d-%m-%YT%H:%M:%S', errors='coerce'
         )
-    # Extract the date component only, ignoring the time
-    validated_df['date_only'] = validated_df['time'].dt.strftime('%d-%m-%Y')
+    # Index on the time so date ranges can be found by binary search
+    validated_df.index = pd.DatetimeIndex(validated_df['time'], name=None)
+    return validated_df.sort_index(kind='stable')
 
 
 def validate_input_dates(
@@ -1003,9 +3354,9 @@ def validate_input_dates(
                         )
 
         # Ensure the date falls within the available range
-        if date < pd.to_datetime(df_first_date) or date > pd.to_datetime(
-                df_last_date
-                ):
+        if date < pd.to_datetime(
+                df_first_date, format='%d-%m-%Y'
+                ) or date > pd.to_datetime(df_last_date, format='%d-%m-%Y'):
             raise ValueError(
                 f"Date {date_str} is outside the available data range."
                 )
@@ -1045,8 +3396,8 @@ def get_user_dates(validated_df, error_log_data, error_log):
        - Writes any date-related errors to the error log in Google Sheets.
 
     Args:
-    - validated_df (pd.DataFrame): A DataFrame containing a 'time' column
-      with date and time data in the format '%d-%m-%YT%H:%M:%S'.
+    - validated_df (pd.DataFrame): A DataFrame sorted on a datetime index,
+      as returned by format_df_date.
     - error_log_data (list): A list to accumulate entries for the error log.
     - error_log (gspread.models.Worksheet): The Google Sheet worksheet for
       the error log.
@@ -1058,15 +3409,10 @@ def get_user_dates(validated_df, error_log_data, error_log):
     # Declare variable for later use
     error_log_data = []
 
-    # Convert the time column in validated_df to date time
-    validated_df['time'] = pd.to_datetime(
-        validated_df['time'],
-        format='%d-%m-%YT%H:%M:%S'
-        )
-
-    # Get the first and last dates available in the data frame
-    df_first_date = validated_df['time'].min().strftime('%d-%m-%Y')
-    df_last_date = validated_df['time'].max().strftime('%d-%m-%Y')
+    # Get the first and last dates available in the data frame, which
+    # is sorted on its datetime index
+    df_first_date = validated_df.index[0].strftime('%d-%m-%Y')
+    df_last_date = validated_df.index[-1].strftime('%d-%m-%Y')
     print(f"\n\nAvailable data range: {df_first_date} to {df_last_date}\n\n")
     print("You will be asked to enter a start date and and end date")
     print(">>> You can type 'quit' at any time to exit. <<<\n")
@@ -1147,11 +3493,7 @@ def get_user_dates(validated_df, error_log_data, error_log):
     user_input_end_date_str = user_input_end_date.strftime('%d-%m-%Y')
 
     # Write any errors to log
-    handle_log_update(
-        error_log.update, error_log,
-        df_to_list_of_lists(pd.DataFrame(error_log_data)),
-        log_name='error log'
-        )
+    LOG_SINK.write(error_log, error_log_data, log_name='error log')
 
     return user_input_start_date_str, user_input_end_date_str
 
@@ -1161,25 +3503,26 @@ def filter_data_by_date(validated_df, start_date, end_date):
     Filter the DataFrame to include only rows within the specified date range.
 
     This function filters the input DataFrame based on a date range defined by
-    `start_date` and `end_date`.
-    It assumes the DataFrame contains a 'date_only' column with dates formatted
-    as 'day-month-year'.
+    `start_date` and `end_date`, including every row on both dates.
+    It assumes the DataFrame is sorted on a datetime index, as returned by
+    format_df_date, so the range is found by binary search in O(log n)
+    and returned as a slice without copying the rows.
 
     Args:
-    - validated_df (pd.DataFrame): The input DataFrame containing a 'date_only'
+    - validated_df (pd.DataFrame): The input DataFrame sorted on a
+    datetime index.
     - start_date (pd.Timestamp or str): The start date of the range to filter.
     - end_date (pd.Timestamp or str): The end date of the range to filter.
     """
-    return validated_df[
-        (pd.to_datetime(
-            validated_df['date_only'],
-            format='%d-%m-%Y'
-            ) >= start_date) &
-        (pd.to_datetime(
-            validated_df['date_only'],
-            format='%d-%m-%Y'
-            ) <= end_date)
-        ]
+    start_date = pd.to_datetime(start_date, format='%d-%m-%Y').normalize()
+    end_date = pd.to_datetime(end_date, format='%d-%m-%Y').normalize()
+
+    # Binary search the sorted index for the first row on the start date
+    # and the first row after the end date, and slice between them
+    start_row, end_row = validated_df.index.searchsorted(
+        [start_date, end_date + pd.Timedelta(days=1)], side='left'
+        )
+    return validated_df.iloc[start_row:end_row]
 
 
 def format_df_data_for_display(date_filtered_df):
@@ -1194,18 +3537,21 @@ def format_df_data_for_display(date_filtered_df):
     that the datetime values are presented in a user-friendly format suitable
     for display purposes.
 
+    The datetime index used to find the date range is dropped, as the
+    time is already shown in the 'time' column.
+
     Args:
     - date_filtered_df (pd.DataFrame): The input DataFrame containing at least
     a 'time' column with datetime values.
     """
     # Create a copy of date_filtered_df to avoid modifying the original
     # DataFrame
-    working_data_df = date_filtered_df.copy()
+    working_data_df = date_filtered_df.reset_index(drop=True)
 
     # Convert the 'time' column to the desired format in the copied DataFrame
-    working_data_df['time'] = pd.to_datetime(
-        working_data_df['time']
-        ).dt.strftime('%d-%m-%Y %H:%M:%S')
+    working_data_df['time'] = working_data_df['time'].dt.strftime(
+        DISPLAY_TIME_FORMAT
+        )
 
     return working_data_df
 
@@ -1262,21 +3608,15 @@ def get_data_selection(error_log):
 
             # Create relevant data subset dataframes for processing
             if selection == 1:
-                selected_columns = ['time', 'AtmosphericPressure',
-                                    'WindDirection',
-                                    'WindSpeed', 'Gust', 'WaveHeight',
-                                    'WavePeriod',
-                                    'MeanWaveDirection', 'AirTemperature',
-                                    'SeaTemperature', 'RelativeHumidity']
+                selected_columns = list(COLUMN_GROUPS['all'])
             elif selection == 2:
-                selected_columns = ['time', 'AtmosphericPressure']
+                selected_columns = list(COLUMN_GROUPS['atmospheric'])
             elif selection == 3:
-                selected_columns = ['time', 'WindSpeed', 'Gust']
+                selected_columns = list(COLUMN_GROUPS['wind'])
             elif selection == 4:
-                selected_columns = ['time', 'WaveHeight', 'WavePeriod',
-                                    'MeanWaveDirection']
+                selected_columns = list(COLUMN_GROUPS['wave'])
             elif selection == 5:
-                selected_columns = ['time', 'AirTemperature', 'SeaTemperature']
+                selected_columns = list(COLUMN_GROUPS['temperature'])
             elif selection == 6:
                 return []  # Exit the function, returning an empty list.
             else:
@@ -1305,11 +3645,7 @@ def get_data_selection(error_log):
             print("\nPlease enter 1, 2, 3, 4, 5, 6 to exit\n")
 
         # Write any errors to log
-        handle_log_update(
-            error_log.update, error_log,
-            df_to_list_of_lists(pd.DataFrame(error_log_data)),
-            log_name='error log'
-            )
+        LOG_SINK.write(error_log, error_log_data, log_name='error log')
 
     return selected_columns
 
@@ -1352,8 +3688,9 @@ def determine_output_options(num_rows):
 
 def get_output_selection(
         user_output_df, user_data_output, selected_columns, allow_screen,
-        allow_graph, allow_sheet, num_rows, SCOPED_CREDS,
-        user_data_output_url, error_log, graphical_output_data_url
+        allow_graph, allow_sheet, num_rows, storage,
+        user_data_output_url, error_log, graphical_output_data_url,
+        graphical_output_sheet=None
         ):
     """
     Prompts the user to select an output option for a DataFrame and performs
@@ -1386,11 +3723,14 @@ def get_output_selection(
       to a Google Sheet is available.
     - num_rows (int): Number of rows in `user_output_df`. Used to determine
       how many rows to display on the screen.
-    - SCOPED_CREDS (Credentials): Credentials for accessing Google Sheets.
+    - storage (GoogleSheetsBackend or LocalBackend): The storage
+      backend the chart is written with.
     - user_data_output_url (str): URL of the Google Sheet where the data
       will be written.
     - error_log (gspread.models.Worksheet): The Google Sheet worksheet for
       the error log.
+    - graphical_output_sheet (gspread.models.Worksheet, optional): The
+      worksheet for the chart data. Defaults to None.
 
     Returns:
     - None: The function handles user interactions and performs actions
@@ -1425,13 +3765,13 @@ def get_output_selection(
                 y_cols = [col for col in selected_columns if col != x_col]
                 title = 'Weather Data Over Time'
                 user_requested_graph(
-                    user_output_df, x_col, y_cols, title, SCOPED_CREDS,
-                    graphical_output_data_url
+                    user_output_df, x_col, y_cols, title, storage,
+                    graphical_output_data_url, graphical_output_sheet
                     )
             # If user selects 3 - output to google sheet
             elif output_selection == 3:
                 # Option 3 Write Data To Google Sheet
-                set_with_dataframe(user_data_output, user_output_df)
+                storage.write_dataframe(user_data_output, user_output_df)
                 print("\nData Written To Google Sheet")
                 print(
                     f"    \nData Output Can Be Found Here:"
@@ -1448,14 +3788,15 @@ def get_output_selection(
 
 
 def data_initialisation_and_validation(
-        session_log_url, gael_force_error_log_url,
+        storage, session_log_url, gael_force_error_log_url,
         session_log, error_log, unvalidated_master_data,
         date_time_error_log, atmos_outliers_url,
         validated_master_data, validated_master_data_url,
         wave_outlier_log, temp_outlier_log,
         atmos_outlier_log, wind_outliers_url,
         wave_outliers_url, temp_outliers_url,
-        wind_outlier_log, date_time_url
+        wind_outlier_log, date_time_url, use_snapshot=True,
+        master_data=None
         ):
     """
     Initializes and validates marine data, and sets up the validated data
@@ -1476,10 +3817,19 @@ def data_initialisation_and_validation(
        - Stores the validated data in a specified location for further use
          in the session.
 
+    If there is a local snapshot, only the rows appended to the master
+    data worksheet since it was taken are read, and the whole worksheet
+    is only read when a full check is due (see load_master_data). If no
+    rows have been appended, validation is skipped and the validated data
+    is restored from the snapshot. With use_snapshot set to False the
+    snapshot is ignored, and every row is read and validated again.
+
     This function is intended to be run once per session to ensure data
     integrity and prepare the data for subsequent processing.
 
     Args:
+    - storage (GoogleSheetsBackend or LocalBackend): The storage backend
+      the worksheets belong to.
     - session_log_url (str): URL for the Google Sheet containing the
       session log.
     - gael_force_error_log_url (str): URL for the Google Sheet containing
@@ -1513,355 +3863,554 @@ def data_initialisation_and_validation(
       worksheet for wind outliers.
     - date_time_url (str): URL for the Google Sheet containing date and
       time validation errors.
+    - use_snapshot (bool, optional): Whether to use the local snapshot.
+      Defaults to True.
+    - master_data (dict, optional): The master data already loaded by
+      load_master_data against the current snapshot. Defaults to None,
+      which loads it here.
 
     Returns:
-    - pd.DataFrame: The validated data frame ready for use in the session.
+    - tuple: The validated data frame ready for use in the session, the
+      aggregate cube of the validated data, and the revision key of the
+      master data it was built from.
     """
+    snapshot = None
+    if use_snapshot:
+        with PROFILER.phase('snapshot_load'):
+            snapshot = load_master_data_snapshot()
+
+    # Read the master data, or only its new rows if there is a snapshot
+    if master_data is None:
+        with PROFILER.phase('master_data_load'):
+            master_data = load_master_data(unvalidated_master_data, snapshot)
+        if master_data is None:
+            return None, None, None
+    revision = master_data['revision']
+    checked_at = master_data['checked_at']
+    new_row_count = master_data['new_row_count']
+    master_data = master_data['rows']
+
     print("\n")
     print("#############################################################")
     print(">>>>>   Phase 1. Starting Data Validation Process       <<<<<")
     print("#############################################################")
     print("\n")
-    # Load the marine data for validation
-    master_data, session_log_data, error_log_data = (
+    # Use the local snapshot if the master data has not changed
+    if snapshot is not None and snapshot['revision'] == revision:
+        with PROFILER.phase('snapshot_restore'):
+            validated_df = restore_master_data_snapshot(
+                storage, snapshot, session_log_url, gael_force_error_log_url,
+                session_log, error_log, date_time_error_log,
+                validated_master_data, validated_master_data_url,
+                atmos_outlier_log, atmos_outliers_url,
+                wind_outlier_log, wind_outliers_url,
+                wave_outlier_log, wave_outliers_url,
+                temp_outlier_log, temp_outliers_url
+                )
+        return validated_df, snapshot['cube'], revision
+
+    # Set up the logs for validation
+    master_data, session_log_data, error_log_data, new_row_count = (
         load_marine_data_input_sheet(
             session_log_url, gael_force_error_log_url,
-            session_log, error_log, unvalidated_master_data
+            session_log, error_log, master_data, new_row_count
             ))
 
+    # If rows have only been appended, the rows validated in the last
+    # snapshot and their outlier statistics are reused rather than
+    # validated again. If the sheet was edited, the rows before the first
+    # edit are kept and the outlier statistics are computed again.
+    outlier_detectors = {}
+    validation_state = new_validation_state()
+    previous_state = snapshot.get('validation') if snapshot else None
+    if previous_state is not None and (
+            len(previous_state['outcomes']) == snapshot['watermark'] - 1
+            and previous_state['stages'] == VALIDATION_STAGE_ORDER):
+        if new_row_count is not None:
+            outlier_detectors = snapshot.get('outlier_detectors', {})
+            validation_state = previous_state
+        else:
+            validation_state = rewind_validation_state(
+                previous_state, master_data
+                )
+
     # Create a validated data frame for use in the app
-    validated_df = validate_master_data(
-        master_data, session_log_data, error_log_data,
-        session_log, error_log, date_time_error_log,
-        validated_master_data, validated_master_data_url,
-        atmos_outlier_log, atmos_outliers_url,
-        wind_outlier_log, wind_outliers_url,
-        wave_outlier_log, wave_outliers_url,
-        temp_outlier_log, temp_outliers_url,
-        date_time_url
+    with PROFILER.phase('validation'):
+        validated_df, validation_logs = validate_master_data(
+            storage, master_data, session_log_data, error_log_data,
+            session_log, error_log, date_time_error_log,
+            validated_master_data, validated_master_data_url,
+            atmos_outlier_log, atmos_outliers_url,
+            wind_outlier_log, wind_outliers_url,
+            wave_outlier_log, wave_outliers_url,
+            temp_outlier_log, temp_outliers_url,
+            date_time_url, outlier_detectors, validation_state
+            )
+
+    # Summarise the validated data by day, week and month. If rows have
+    # only been appended, add them to the cube from the last snapshot.
+    previous_cube = None
+    if new_row_count is not None:
+        previous_cube = snapshot['cube']
+    with PROFILER.phase('aggregate_cube'):
+        aggregate_cube = update_aggregate_cube(previous_cube, validated_df)
+
+    # Snapshot the data so the next session only reads and validates
+    # the rows appended since
+    with PROFILER.phase('snapshot_save'):
+        save_master_data_snapshot(
+            revision, master_data, validated_df, validation_logs,
+            aggregate_cube, outlier_detectors, validation_state,
+            checked_at
+            )
+
+    return validated_df, aggregate_cube, revision
+
+
+def convert_dataframe(df, x_col, y_cols, time_format=None):
+    """
+    Convert specific columns in a DataFrame to appropriate data types.
+
+    This function converts the data types of specified columns in a DataFrame
+    to ensure that they are in the correct format for analysis or plotting.
+
+    The function performs the following conversions:
+    1. **Datetime Conversion:**
+       - Converts the column specified by `x_col` to datetime format,
+         using `time_format` when it is given.
+       - Handles invalid parsing by setting errors to 'coerce', which
+         results in NaT (Not a Time) for invalid entries.
+
+    2. **Numeric Conversion:**
+       - Converts the columns specified in `y_cols` to numeric format.
+       - Handles invalid parsing by setting errors to 'coerce', which
+         results in NaN (Not a Number) for invalid entries.
+
+    Args:
+    - df (pd.DataFrame): The DataFrame containing the data to be converted.
+    - x_col (str): The name of the column to be converted to datetime format.
+    - y_cols (list of str): A list of column names to be converted to
+      numeric format.
+    - time_format (str, optional): The strftime format of the x_col
+      values. Defaults to None, which infers the format.
+
+    Returns:
+    - pd.DataFrame: A new DataFrame holding x_col followed by y_cols,
+      each converted to the appropriate data type. The input DataFrame
+      is not modified.
+    """
+    # Convert the x_col to datetime if it represents dates
+    converted_df = pd.DataFrame(
+        {x_col: pd.to_datetime(df[x_col], format=time_format,
+                               errors='coerce')},
+        index=df.index
         )
 
-    return validated_df
+    # Convert y_cols to numeric
+    for col in y_cols:
+        converted_df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    return converted_df
+
+
+def build_chart_values(df, x_col, y_cols):
+    """
+    Builds the rows of chart data written to the chart data worksheet.
+
+    The x values are formatted as dates in a single pass over the column
+    and each row is assembled from whole column arrays, so no Python
+    work is done per cell.
+
+    Args:
+    - df (pd.DataFrame): The chart data, with datetime x values and
+      numeric y values.
+    - x_col (str): The name of the x axis column.
+    - y_cols (list of str): The names of the series columns.
+
+    Returns:
+    - list of list: The header row followed by one row per data point.
+    """
+    columns = [df[x_col].dt.strftime('%Y-%m-%d').to_numpy(dtype=object)]
+    for col in y_cols:
+        columns.append(df[col].to_numpy(dtype=np.float64).astype(object))
+
+    values = [[x_col] + list(y_cols)]
+    values.extend(np.column_stack(columns).tolist())
+
+    return values
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Chooses the points of a series to keep when it is downsampled, using
+    the largest triangle three buckets algorithm.
+
+    The first and last points are always kept. The points in between are
+    split into equal buckets, and from each bucket the point forming the
+    largest triangle with the point kept from the previous bucket and
+    the average of the next bucket is kept. This keeps the peaks and
+    troughs that give a line chart its shape.
+
+    Args:
+    - x (np.ndarray): The x values of the series, in ascending order.
+    - y (np.ndarray): The y values of the series.
+    - threshold (int): The number of points to keep.
+
+    Returns:
+    - np.ndarray: The positions of the points to keep, in order.
+    """
+    num_points = len(x)
+    if threshold >= num_points or threshold < 3:
+        return np.arange(num_points)
+
+    bucket_size = (num_points - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = num_points - 1
+
+    selected = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, num_points)
+
+        # Average of the next bucket, the third point of the triangle
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Twice the area of each candidate triangle
+        areas = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected]) -
+            (x[selected] - x[start:end]) * (avg_y - y[selected])
+            )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+
+    return indices
+
+
+def downsample_for_chart(df, x_col, y_cols, point_budget):
+    """
+    Reduces the rows of chart data to those needed to draw each series.
+
+    Each series is downsampled with lttb_indices to point_budget points,
+    and the rows chosen for any series are kept, so every series keeps
+    its shape on the shared x axis.
+
+    Args:
+    - df (pd.DataFrame): The chart data, with datetime x values in
+      ascending order and numeric y values.
+    - x_col (str): The name of the x axis column.
+    - y_cols (list of str): The names of the series columns.
+    - point_budget (int): The number of points to keep for each series.
+
+    Returns:
+    - pd.DataFrame: The rows of df needed to draw the chart.
+    """
+    if len(df) <= point_budget:
+        return df
+
+    x = df[x_col].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    x = x.astype(np.float64)
+    keep = np.zeros(len(df), dtype=bool)
+    for col in y_cols:
+        y = df[col].to_numpy(dtype=np.float64)
+        keep[lttb_indices(x, y, point_budget)] = True
+
+    return df[keep]
+
+
+def load_chart_id(spreadsheet_id, sheet_id):
+    """
+    Returns the ID of the chart last drawn on a chart data worksheet.
+
+    Args:
+    - spreadsheet_id (str): The ID of the spreadsheet holding the chart.
+    - sheet_id (int): The ID of the worksheet holding the chart.
+
+    Returns:
+    - int or None: The remembered chart ID, or None if no chart has been
+      drawn on the worksheet from this machine.
+    """
+    try:
+        with open(CHART_STATE_FILE) as state_file:
+            chart_ids = json.load(state_file)
+    except (OSError, ValueError):
+        return None
+
+    return chart_ids.get(f"{spreadsheet_id}:{sheet_id}")
+
+
+def save_chart_id(spreadsheet_id, sheet_id, chart_id):
+    """
+    Remembers the ID of the chart drawn on a chart data worksheet, so the
+    next chart can update it in place.
+
+    Args:
+    - spreadsheet_id (str): The ID of the spreadsheet holding the chart.
+    - sheet_id (int): The ID of the worksheet holding the chart.
+    - chart_id (int or None): The chart ID, or None to forget it.
+    """
+    try:
+        with open(CHART_STATE_FILE) as state_file:
+            chart_ids = json.load(state_file)
+    except (OSError, ValueError):
+        chart_ids = {}
+
+    key = f"{spreadsheet_id}:{sheet_id}"
+    if chart_id is None:
+        chart_ids.pop(key, None)
+    else:
+        chart_ids[key] = chart_id
+
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        with open(CHART_STATE_FILE, 'w') as state_file:
+            json.dump(chart_ids, state_file)
+    except OSError as e:
+        print(f"Could not save the chart ID: {e}")
 
 
-def convert_dataframe(df, x_col, y_cols):
+def build_chart_data_request(sheet_id, values):
     """
-    Convert specific columns in a DataFrame to appropriate data types.
-
-    This function converts the data types of specified columns in a DataFrame
-    to ensure that they are in the correct format for analysis or plotting.
-
-    The function performs the following conversions:
-    1. **Datetime Conversion:**
-       - Converts the column specified by `x_col` to datetime format.
-       - Handles invalid parsing by setting errors to 'coerce', which
-         results in NaT (Not a Time) for invalid entries.
+    Builds the request that writes the chart data to its worksheet.
 
-    2. **Numeric Conversion:**
-       - Converts the columns specified in `y_cols` to numeric format.
-       - Handles invalid parsing by setting errors to 'coerce', which
-         results in NaN (Not a Number) for invalid entries.
+    The request covers the whole worksheet, so any rows left over from a
+    longer chart are cleared in the same request.
 
     Args:
-    - df (pd.DataFrame): The DataFrame containing the data to be converted.
-    - x_col (str): The name of the column to be converted to datetime format.
-    - y_cols (list of str): A list of column names to be converted to
-      numeric format.
+    - sheet_id (int): The ID of the chart data worksheet.
+    - values (list of lists): The header row followed by the data rows.
+      Text is written as text and numbers as numbers. Missing values are
+      written as empty cells.
 
     Returns:
-    - pd.DataFrame: The DataFrame with specified columns converted to
-      the appropriate data types.
+    - dict: An updateCells request for a spreadsheets batchUpdate.
     """
-    # Convert the x_col to datetime if it represents dates
-    df.loc[:, x_col] = pd.to_datetime(df[x_col], errors='coerce')
-
-    # Convert y_cols to numeric
-    for col in y_cols:
-        df.loc[:, col] = pd.to_numeric(df[col], errors='coerce')
-
-    return df
+    def to_cell(value):
+        if isinstance(value, str):
+            return {'userEnteredValue': {'stringValue': value}}
+        if value is None or value != value:
+            return {}
+        return {'userEnteredValue': {'numberValue': value}}
+
+    rows = [{'values': [to_cell(value) for value in row]} for row in values]
+
+    return {
+        'updateCells': {
+            'rows': rows,
+            'fields': 'userEnteredValue',
+            'range': {
+                'sheetId': sheet_id,
+                'startRowIndex': 0,
+                'startColumnIndex': 0
+                }
+            }
+        }
 
 
-def write_data_to_sheet(service, spreadsheet_id, sheet_name, values):
+def build_chart_spec(sheet_id, x_col, y_cols, title, end_row_index):
     """
-    Write data to the specified Google Sheet.
+    Builds the specification of a line chart with the legend positioned
+    on the right, using the first row of the chart data as headers.
 
-    This function uses the Google Sheets API to write data to a specific sheet
-    within a Google Spreadsheet. The data is written starting from cell A1.
+    The x-axis is defined by the first column of the chart data and the
+    series by the columns after it, one for each of `y_cols`.
 
     Args:
-    - service: Authorized Google Sheets API service instance. This is an
-      instance
-      of the `googleapiclient.discovery.Resource` class, which allows
-     interaction with the Google Sheets API.
-    - spreadsheet_id (str): The unique identifier of the Google
-      Spreadsheet where the data will be written. This can be found in the
-      URL of the spreadsheet.
-    - sheet_name (str): The name of the sheet within the spreadsheet
-      where the data will be written. For example, 'Sheet1'.
-    - values (list of lists): The data to be written to the sheet.
-      Each inner list represents a row of data, and each element within the
-      inner list represents a cell in that row.
+    - sheet_id (int): The ID of the chart data worksheet.
+    - x_col (str): The header name of the column used for the x-axis.
+    - y_cols (list of str): The header names of the columns used for the
+      y-axis (multiple series) of the chart.
+    - title (str): The title of the chart.
+    - end_row_index (int): The number of rows of chart data, including
+      the header row.
 
     Returns:
-    - None: This function does not return a value. It writes the
-      data directly to the specified Google Sheet.
-
-    Raises:
-    - HttpError: If there is an issue with the HTTP request to the
-      Google Sheets API.
-    - GoogleAuthError: If there is an issue with authentication
-      while accessing the API.
-    - Exception: For any other unexpected errors that occur during
-      the operation.
+    - dict: The ChartSpec of the chart.
     """
-    try:
-        body = {'values': values}
-        range_ = f'{sheet_name}!A1'
-        service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=range_,
-            valueInputOption='RAW',
-            body=body
-            ).execute()
-    except HttpError as e:
-        print(f"HTTP error occurred while writing data: {e}")
-    except GoogleAuthError as e:
-        print(f"Authentication error occurred: {e}")
-    except Exception as e:
-        print(f"An error occurred while writing data: {e}")
+    return {
+        'title': title,
+        'basicChart': {
+            'chartType': 'LINE',
+            'legendPosition': 'RIGHT_LEGEND',
+            # Position the legend on the right
+            'headerCount': 1,
+            # This sets the first row as headers
+            'axis': [
+                {
+                    'position': 'BOTTOM_AXIS',
+                    'title': x_col
+                    },  # X-axis title
+                {
+                    'position': 'LEFT_AXIS',
+                    'title': 'Values'
+                    }  # Y-axis title
+                ],
+            'domains': [
+                {
+                    'domain': {
+                        'sourceRange': {
+                            'sources': [
+                                {
+                                    'sheetId': sheet_id,
+                                    'startRowIndex': 0,
+                                    # Data starts in the header
+                                    'endRowIndex': end_row_index,
+                                    'startColumnIndex': 0,
+                                    'endColumnIndex': 1
+                                    }
+                                ]
+                            }
+                        }
+                    }
+                ],
+            'series': [
+                {
+                    'series': {
+                        'sourceRange': {
+                            'sources': [
+                                {
+                                    'sheetId': sheet_id,
+                                    'startRowIndex': 0,
+                                    # Data starts in the header
+                                    'endRowIndex': end_row_index,
+                                    'startColumnIndex': col_index,
+                                    'endColumnIndex': col_index + 1
+                                    }
+                                ]
+                            }
+                        }
+                    } for col_index in range(1, len(y_cols) + 1)
+                ]
+            }
+        }
 
 
-def delete_existing_charts(service, spreadsheet_id):
+def find_sheet_charts(service, spreadsheet_id, sheet_id):
     """
-    Check if there are existing charts in the specified Google Sheet and
-    delete them if found.
-
-    This function uses the Google Sheets API to identify and remove any charts
-    that are embedded in the specified Google Spreadsheet. It performs a batch
-    update request to delete all found charts.
+    Finds the charts on a worksheet, fetching only the chart IDs rather
+    than the metadata of the whole spreadsheet.
 
     Args:
     - service: Authorized Google Sheets API service instance.
-      This is an instance of the `googleapiclient.discovery.Resource` class,
-      which allows interaction with the Google Sheets API.
-    - spreadsheet_id (str): The unique identifier of the Google
-      Spreadsheet where the charts will be deleted. This ID can be found in
-      the URL of the spreadsheet.
+    - spreadsheet_id (str): The ID of the spreadsheet.
+    - sheet_id (int): The ID of the worksheet.
 
     Returns:
-    - None: This function does not return a value.
-      It directly performs the deletion of charts in the specified Google
-      Sheet.
-
-    Raises:
-    - HttpError: If there is an issue with the HTTP request to the
-      Google Sheets API.
-    - GoogleAuthError: If there is an issue with authentication while
-      accessing the API.
-    - Exception: For any other unexpected errors that occur during
-      the operation.
+    - list of int: The IDs of the charts on the worksheet.
     """
-    try:
-        # Retrieve the spreadsheet information
-        spreadsheet = service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id
-            ).execute()
+    spreadsheet = service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields='sheets(properties(sheetId),charts(chartId))'
+        ).execute()
 
-        # Extract sheet information
-        sheets = spreadsheet.get('sheets', [])
-        charts_to_delete = []
+    for sheet in spreadsheet.get('sheets', []):
+        if sheet.get('properties', {}).get('sheetId') == sheet_id:
+            return [chart['chartId'] for chart in sheet.get('charts', [])]
 
-        # Iterate over sheets to find charts
-        for sheet in sheets:
-            sheet_id = sheet.get('properties', {}).get('sheetId')
-            sheet_name = sheet.get('properties', {}).get('title')
-            if 'charts' in sheet:
-                for chart in sheet.get('charts', []):
-                    chart_id = chart.get('chartId')
-                    charts_to_delete.append(chart_id)
-
-        # Delete charts if any are found
-        if charts_to_delete:
-            requests = [{'deleteEmbeddedObject': {'objectId': chart_id}} for
-                        chart_id in charts_to_delete]
-            batch_update_request = {'requests': requests}
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=batch_update_request
-                ).execute()
+    return []
 
-            print(
-                f"Deleted {len(charts_to_delete)} charts from "
-                f"the Google Sheet."
-                )
-        else:
-            print("No charts found to delete.")
 
-    except HttpError as e:
-        print(f"HTTP error occurred: {e}")
-    except GoogleAuthError as e:
-        print(f"Authentication error occurred: {e}")
-    except Exception as e:
-        print(f"An error occurred: {e}")
+def refresh_chart(service, spreadsheet_id, sheet_id, x_col, y_cols,
+                  title, values):
+    """
+    Writes the chart data and redraws the chart in one batch update.
 
+    The chart drawn last time is updated in place, using the chart ID
+    remembered by save_chart_id, so no charts are deleted and re-added
+    and the spreadsheet metadata is not fetched. When no chart ID is
+    remembered, or the remembered chart has been removed from the sheet,
+    the chart IDs of the worksheet are fetched once. An existing chart
+    is then reused and any others deleted, or a new chart is added when
+    there is none.
 
-def add_chart_to_sheet(
-        service, spreadsheet_id, sheet_id, x_col, y_cols,
-        title, graphical_output_data_url
-        ):
-    """
-    Add a chart to the specified Google Sheet with the legend positioned
-    on the right, and configure the chart to use the first row as headers.
-
-    This function first deletes any existing charts in the specified Google
-    Sheet to ensure that the new chart is added cleanly. It then creates a
-    line chart where the x-axis is defined by the `x_col` and multiple
-    y-axis series are defined by `y_cols`. The chart is placed on the sheet
-    with a title and the legend positioned on the right.
-
-    Args:
-    - service: Authorized Google Sheets API service instance. This instance
-      is used to interact with the Google Sheets API.
-    - spreadsheet_id (str): The unique identifier of the Google Spreadsheet
-      where the chart will be added. This ID can be found in the URL of the
-      spreadsheet.
-    - sheet_id (int): The ID of the sheet within the spreadsheet where the
-      chart will be added.
-    - x_col (str): The header name or index of the column to be used for
-      the x-axis of the chart.
-    - y_cols (list of str): List of header names or indices of the columns
-      to be used for the y-axis (multiple series) of the chart.
+    Args:
+    - service: Authorized Google Sheets API service instance.
+    - spreadsheet_id (str): The ID of the spreadsheet.
+    - sheet_id (int): The ID of the chart data worksheet.
+    - x_col (str): The header name of the column used for the x-axis.
+    - y_cols (list of str): The header names of the columns used for the
+      y-axis (multiple series) of the chart.
     - title (str): The title of the chart.
+    - values (list of lists): The header row followed by the data rows,
+      with the x values first and the y_cols values after them.
 
     Returns:
-    - None: This function does not return a value. It directly performs
-      the addition of the chart to the specified Google Sheet.
+    - int: The ID of the chart.
 
     Raises:
-    - HttpError: If there is an issue with the HTTP request to the Google
-      Sheets API.
-    - GoogleAuthError: If there is an issue with authentication while
-      accessing the API.
-    - Exception: For any other unexpected errors that occur during the
-      operation.
+    - HttpError: If there is an issue with the HTTP request to the
+      Google Sheets API.
     """
-    delete_existing_charts(service, spreadsheet_id)
-    try:
-        # Determine the data range for the chart
-        # Assuming that the number of rows matches the length of y_cols
-        end_row_index = len(
-            y_cols
-            ) + 1
-
-        # Create the requests to add the chart
-        # Define your chart specifications
-        requests = [
+    spec = build_chart_spec(sheet_id, x_col, y_cols, title, len(values))
+    position = {
+        'overlayPosition': {
+            'anchorCell': {
+                'sheetId': sheet_id,
+                'rowIndex': 0,
+                'columnIndex': len(y_cols) + 2
+                # Adjust to place the chart appropriately
+                },
+            'offsetXPixels': 0,
+            'offsetYPixels': 0
+            }
+        }
+    data_request = build_chart_data_request(sheet_id, values)
+
+    def update_chart_requests(chart_id):
+        return [
+            {'updateChartSpec': {'chartId': chart_id, 'spec': spec}},
             {
-                'addChart': {
-                    'chart': {
-                        'spec': {
-                            'title': title,
-                            'basicChart': {
-                                'chartType': 'LINE',
-                                'legendPosition': 'RIGHT_LEGEND',
-                                # Position the legend on the right
-                                'headerCount': 1,
-                                # This sets the first row as headers
-                                'axis': [
-                                    {
-                                        'position': 'BOTTOM_AXIS',
-                                        'title': x_col
-                                        },  # X-axis title
-                                    {
-                                        'position': 'LEFT_AXIS',
-                                        'title': 'Values'
-                                        }  # Y-axis title
-                                    ],
-                                'domains': [
-                                    {
-                                        'domain': {
-                                            'sourceRange': {
-                                                'sources': [
-                                                    {
-                                                        'sheetId': sheet_id,
-                                                        'startRowIndex': 0,
-                                                        # Data starts in
-                                                        # the header
-                                                        'endRowIndex':
-                                                            end_row_index,
-                                                        'startColumnIndex': 0,
-                                                        'endColumnIndex': 1
-                                                        }
-                                                    ]
-                                                }
-                                            }
-                                        }
-                                    ],
-                                'series': [
-                                    {
-                                        'series': {
-                                            'sourceRange': {
-                                                'sources': [
-                                                    {
-                                                        'sheetId': sheet_id,
-                                                        'startRowIndex': 0,
-                                                        # Data starts in
-                                                        # the header
-                                                        'endRowIndex':
-                                                            end_row_index,
-                                                        'startColumnIndex':
-                                                            col_index,
-                                                        'endColumnIndex':
-                                                            col_index + 1
-                                                        }
-                                                    ]
-                                                }
-                                            }
-                                        } for col_index in
-                                    range(1, len(y_cols) + 1)
-                                    ]
-                                }
-                            },
-                        'position': {
-                            'overlayPosition': {
-                                'anchorCell': {
-                                    'sheetId': sheet_id,
-                                    'rowIndex': 0,
-                                    'columnIndex': len(y_cols) + 2
-                                    # Adjust to place the chart appropriately
-                                    },
-                                'offsetXPixels': 0,
-                                'offsetYPixels': 0
-                                }
-                            }
-                        }
+                'updateEmbeddedObjectPosition': {
+                    'objectId': chart_id,
+                    'newPosition': position,
+                    'fields': 'overlayPosition'
                     }
                 }
             ]
 
-        # Execute the batch update request
-        batch_update_request = {'requests': requests}
-        service.spreadsheets().batchUpdate(
+    def batch_update(requests):
+        return service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            body=batch_update_request
+            body={'requests': requests}
             ).execute()
 
-        print("Chart has been created in the Google Sheet")
-        print(
-            f"    \nYou Can View Your Chart Here:"
-            f"\n\n{graphical_output_data_url}\n\n"
-            )
-    except HttpError as e:
-        print(f"HTTP error occurred while creating the chart: {e}")
-    except GoogleAuthError as e:
-        print(f"Authentication error occurred: {e}")
-    except Exception as e:
-        print(f"An error occurred while creating the chart: {e}")
+    chart_id = load_chart_id(spreadsheet_id, sheet_id)
+    if chart_id is not None:
+        try:
+            batch_update([data_request] + update_chart_requests(chart_id))
+            return chart_id
+        except googleapiclient_errors.HttpError as e:
+            # A bad request means the remembered chart no longer exists.
+            # The batch is applied all or nothing, so nothing was written.
+            if e.resp.status != 400:
+                raise
+            save_chart_id(spreadsheet_id, sheet_id, None)
+
+    chart_ids = find_sheet_charts(service, spreadsheet_id, sheet_id)
+    if chart_ids:
+        chart_id = chart_ids[0]
+        requests = [data_request] + update_chart_requests(chart_id)
+        requests += [
+            {'deleteEmbeddedObject': {'objectId': other_id}}
+            for other_id in chart_ids[1:]
+            ]
+        batch_update(requests)
+    else:
+        response = batch_update([
+            data_request,
+            {'addChart': {'chart': {'spec': spec, 'position': position}}}
+            ])
+        chart_id = response['replies'][1]['addChart']['chart']['chartId']
+
+    save_chart_id(spreadsheet_id, sheet_id, chart_id)
+    return chart_id
 
 
 def user_requested_graph(df, x_col, y_cols, title,
-                         SCOPED_CREDS, graphical_output_data_url):
+                         storage, graphical_output_data_url,
+                         graphical_output_sheet=None):
     """
     Writes data from a Pandas DataFrame to a specified Google Sheet and
     creates a chart.
@@ -1869,7 +4418,8 @@ def user_requested_graph(df, x_col, y_cols, title,
     This function takes a Pandas DataFrame, extracts specified columns,
     and writes the
     data to a Google Sheet. It then creates a chart in the Google Sheet
-    using the+ specified columns.
+    using the+ specified columns. Local storage has no charts, so there
+    only the chart data is written.
 
     Args:
     - df (pd.DataFrame): The DataFrame containing the data to be written to
@@ -1879,7 +4429,10 @@ def user_requested_graph(df, x_col, y_cols, title,
     - y_cols (list of str): A list of column names in `df` to be used as the
       y-axis in the chart.
     - title (str): The title of the chart to be created in the Google Sheet.
-    - SCOPED_CREDS: Authorized Google Sheets API credentials instance.
+    - storage (GoogleSheetsBackend or LocalBackend): The storage
+      backend the chart is written with.
+    - graphical_output_sheet (gspread.models.Worksheet, optional): The
+      worksheet for the chart data.
 
     Returns:
     - None: This function does not return a value. It performs data writing
@@ -1895,35 +4448,33 @@ def user_requested_graph(df, x_col, y_cols, title,
       the operation.
     """
     try:
-        # Define the Google Sheet ID and the range where data will be written
-        spreadsheet_id = '1cjDvLdeYgYip8yfg4w531LKcoRlo8t8gb8esrI30H6U'
-        sheet_name = 'graphical_output_data'
-        sheet_id = 2079660690  # The specific sheet ID of the output sheet
-        service = build('sheets', 'v4', credentials=SCOPED_CREDS)
+        # The rows keep the datetime index set by format_df_date, which
+        # holds the times shown in x_col, so the text need not be parsed
+        if isinstance(df.index, pd.DatetimeIndex):
+            df = df.assign(**{x_col: df.index})
 
         # Convert the DataFrame to correct data types
-        df = convert_dataframe(df, x_col, y_cols)
+        df = convert_dataframe(df, x_col, y_cols, DISPLAY_TIME_FORMAT)
+
+        # Keep only the points needed to draw each series
+        df = downsample_for_chart(df, x_col, y_cols, CHART_POINT_BUDGET)
 
         # Prepare data to be written to the sheet
-        values = [df.columns.tolist()]  # Header row
-        for index, row in df.iterrows():
-            values.append(
-                [row[x_col].strftime('%Y-%m-%d')] + [row[col] for col in
-                                                     y_cols]
-                )
+        values = build_chart_values(df, x_col, y_cols)
 
-        # Write data to the sheet
-        write_data_to_sheet(service, spreadsheet_id, sheet_name, values)
+        # Write the data and draw the chart, where the backend has charts
+        storage.write_chart(
+            graphical_output_sheet, x_col, y_cols, title, values
+            )
 
-        # Add a chart to the sheet
-        add_chart_to_sheet(
-            service, spreadsheet_id, sheet_id, x_col, y_cols,
-            title, graphical_output_data_url
+        print(
+            f"    \nYou Can View Your Chart Here:"
+            f"\n\n{graphical_output_data_url}\n\n"
             )
 
-    except HttpError as e:
+    except googleapiclient_errors.HttpError as e:
         print(f"HTTP error occurred: {e}")
-    except GoogleAuthError as e:
+    except google_auth_exceptions.GoogleAuthError as e:
         print(f"Authentication error occurred: {e}")
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -2008,11 +4559,7 @@ def get_valid_data_output_selection(
             print("Invalid selection. Please enter a number between 1 and 4.")
 
         # Write any errors to log
-        handle_log_update(
-            error_log.update, error_log,
-            df_to_list_of_lists(pd.DataFrame(error_log_data)),
-            log_name='error log'
-            )
+        LOG_SINK.write(error_log, error_log_data, log_name='error log')
 
     return output_selection
 
@@ -2084,12 +4631,568 @@ def get_continue_yn(error_log):
             print("\nPlease enter (n) to exit\n")
 
         # Write any errors to log
-        handle_log_update(
-            error_log.update, error_log,
-            df_to_list_of_lists(pd.DataFrame(error_log_data)),
-            log_name='error log'
+        LOG_SINK.write(error_log, error_log_data, log_name='error log')
+
+
+def print_import_report(load_time, startup_cpu_time):
+    """
+    Prints how long run.py took to load, and how long each library
+    imported on first use took and which function first used it.
+
+    Args:
+    - load_time (float): The seconds taken to run the body of run.py,
+      after its standard library imports.
+    - startup_cpu_time (float): The CPU seconds used by the process
+      before main started, including the interpreter start up and the
+      compiling of run.py.
+    """
+    print("\n")
+    print("#############################################################")
+    print(">>>>>   Import Report                                   <<<<<")
+    print("#############################################################")
+    print(f"\nStart up CPU time before main: {startup_cpu_time:.3f} seconds")
+    print(f"run.py loaded in {load_time:.3f} seconds\n")
+    if not IMPORT_TIMES:
+        print("No libraries were imported on first use")
+    for entry in IMPORT_TIMES:
+        print(
+            f"{entry['module']:<32}{entry['seconds']:>8.3f}s  "
+            f"first used by {entry['first_use']}"
+            )
+    print("\n")
+
+
+def parse_args():
+    """
+    Parses the command line options of the application.
+
+    Returns:
+    - argparse.Namespace: The options. profile is True to print where the
+      time of the session went when it ends, and profile_stats is the
+      path of the cProfile dump to write, or None.
+    """
+    parser = argparse.ArgumentParser(
+        description="Validate and interrogate the Gael Force marine data."
+        )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="print the wall and CPU time of each phase and Google API "
+             "call when the session ends"
+        )
+    parser.add_argument(
+        '--profile-stats', nargs='?', metavar='PATH',
+        const=os.path.join(
+            SNAPSHOT_DIR, 'profile',
+            f"session-{time.strftime('%Y%m%d-%H%M%S')}.pstats"
+            ),
+        help="also write a cProfile dump of the session, and its phase "
+             "and API call timings as JSON next to it (default: "
+             ".cache/profile/session-<time>.pstats)"
+        )
+
+    parser.add_argument(
+        '--import-report', action='store_true',
+        help="print how long the libraries took to import when the "
+             "session ends"
+        )
+
+    batch = parser.add_argument_group(
+        'batch extract',
+        "Give --start and --end to validate the data, write one extract "
+        "and exit, without any prompts."
+        )
+    batch.add_argument(
+        '--start', metavar='DD-MM-YYYY', help="first date of the extract"
+        )
+    batch.add_argument(
+        '--end', metavar='DD-MM-YYYY', help="last date of the extract"
+        )
+    batch.add_argument(
+        '--columns', choices=list(COLUMN_GROUPS), default='all',
+        help="the data to extract (default: all)"
+        )
+    batch.add_argument(
+        '--output', choices=['screen', 'csv', 'sheet', 'chart'],
+        default='csv',
+        help="where to write the extract: printed in full, as CSV, to the "
+             "user data output worksheet or as a chart (default: csv)"
+        )
+    batch.add_argument(
+        '--output-file', metavar='PATH',
+        help="file the CSV extract is written to (default: standard output)"
+        )
+
+    server = parser.add_argument_group(
+        'session server',
+        "Validate the data once and run each session in a worker forked "
+        "from this process, connected through a Unix socket."
+        )
+    server.add_argument(
+        '--serve', metavar='SOCKET',
+        help="serve sessions on this Unix socket"
+        )
+    server.add_argument(
+        '--pool-size', type=int, default=2,
+        help="workers kept waiting for a session (default: 2)"
+        )
+    server.add_argument(
+        '--refresh-interval', type=int, default=300, metavar='SECONDS',
+        help="seconds between checks for changes to the master data, or "
+             "0 to never check (default: 300)"
+        )
+
+    args = parser.parse_args()
+    if (args.start is None) != (args.end is None):
+        parser.error("--start and --end must be given together")
+    return args
+
+
+def run_batch_extract(
+        validated_df, start_date, end_date, column_group, output,
+        output_file, error_log, user_data_output, user_data_output_url,
+        storage, graphical_output_data_url, graphical_output_sheet,
+        extract_stream=None
+        ):
+    """
+    Writes one extract of the validated data without prompting the user,
+    for scripted and scheduled runs.
+
+    The dates are checked as they are when typed in, and any error is
+    written to the error log.
+
+    Args:
+    - validated_df (pd.DataFrame): The validated data, sorted on a
+      datetime index as returned by format_df_date.
+    - start_date, end_date (str): The first and last dates of the extract,
+      in the format 'dd-mm-yyyy'.
+    - column_group (str): The key in COLUMN_GROUPS of the columns to
+      extract.
+    - output (str): 'screen' to print the extract, 'csv' to write it as
+      CSV, 'sheet' to write it to the user data output worksheet or
+      'chart' to draw it as a chart.
+    - output_file (str): The file the CSV is written to, or None for
+      standard output.
+    - error_log (gspread.models.Worksheet): The worksheet for the error
+      log.
+    - user_data_output (gspread.models.Worksheet): The worksheet for the
+      user data output.
+    - user_data_output_url (str): URL of the user data output worksheet.
+    - storage (GoogleSheetsBackend or LocalBackend): The storage
+      backend the chart is written with.
+    - graphical_output_data_url (str): URL of the chart worksheet.
+    - graphical_output_sheet (gspread.models.Worksheet): The worksheet for
+      the chart data.
+    - extract_stream (file, optional): Where the extract is printed or
+      written as CSV when there is no output file. Defaults to
+      sys.stdout.
+
+    Returns:
+    - bool: True if the extract was written, False if the dates were not
+      valid.
+    """
+    if extract_stream is None:
+        extract_stream = sys.stdout
+    error_log_data = []
+    df_first_date = validated_df.index[0].strftime('%d-%m-%Y')
+    df_last_date = validated_df.index[-1].strftime('%d-%m-%Y')
+    try:
+        start = validate_input_dates(
+            start_date, "start", df_first_date, df_last_date
+            )
+        end = validate_input_dates(
+            end_date, "end", df_first_date, df_last_date
+            )
+        if end < start:
+            raise ValueError(
+                "The end date cannot be earlier than the start date."
+                )
+    except ValueError as e:
+        error_log_data.append(["Batch Date Error", str(pd.Timestamp.now())])
+        error_log_data.append(["Batch Date Error", str(e)])
+        print(f"Date Error: {e}")
+        print(f"Available data range: {df_first_date} to {df_last_date}")
+        LOG_SINK.write(error_log, error_log_data, log_name='error log')
+        return False
+
+    date_filtered_df = filter_data_by_date(validated_df, start_date, end_date)
+    selected_columns = list(COLUMN_GROUPS[column_group])
+    extract_df = format_df_data_for_display(date_filtered_df)[
+        selected_columns
+        ]
+    print(f"\nThere are {len(extract_df)} rows of data.     <<<<<\n")
+
+    if output == 'screen':
+        print(extract_df.to_string(index=False), file=extract_stream)
+    elif output == 'csv':
+        if output_file:
+            try:
+                extract_df.to_csv(output_file, index=False)
+            except OSError as e:
+                print(f"Unable to write the extract: {e}")
+                return False
+            print(f"Data Written To {output_file}")
+        else:
+            extract_df.to_csv(extract_stream, index=False)
+    elif output == 'sheet':
+        storage.write_dataframe(user_data_output, extract_df)
+        print("\nData Written To Google Sheet")
+        print(
+            f"    \nData Output Can Be Found Here:"
+            f"\n\n{user_data_output_url}\n\n"
+            )
+    elif output == 'chart':
+        user_requested_graph(
+            extract_df, 'time', selected_columns[1:],
+            'Weather Data Over Time', storage,
+            graphical_output_data_url, graphical_output_sheet
+            )
+    return True
+
+
+def relay_terminal(connection, master, finished):
+    """
+    Copies the bytes of a terminal session between the client connection
+    and the master side of the session's pseudo terminal, from two
+    threads.
+
+    If the client disconnects before the session ends, the buffered log
+    entries are written and the worker exits.
+
+    Args:
+    - connection (socket.socket): The client connection.
+    - master (int): The file descriptor of the pseudo terminal master.
+    - finished (threading.Event): Set by the worker once the session has
+      ended, so the closing connection is not taken as a disconnect.
+
+    Returns:
+    - threading.Thread: The thread copying the output to the client, which
+      ends once the output has all been sent.
+    """
+    def from_client():
+        while True:
+            try:
+                data = connection.recv(4096)
+            except OSError:
+                data = b''
+            if finished.is_set():
+                return
+            if not data:
+                LOG_SINK.flush()
+                os._exit(0)
+            os.write(master, data)
+
+    def to_client():
+        while True:
+            try:
+                data = os.read(master, 4096)
+                if not data:
+                    return
+                connection.sendall(data)
+            except OSError:
+                return
+
+    threading.Thread(target=from_client, daemon=True).start()
+    output = threading.Thread(target=to_client)
+    output.start()
+    return output
+
+
+def run_session_worker(listener, status_pipe, run_session, session_data):
+    """
+    Runs in a forked worker: waits for one client connection, runs a
+    session for it on a new pseudo terminal and exits.
+
+    The worker tells the server it has taken a connection, by writing its
+    process ID to the status pipe, so the server can fork a replacement.
+
+    Args:
+    - listener (socket.socket): The listening server socket.
+    - status_pipe (int): The write end of the server's status pipe.
+    - run_session (function): Runs one interactive session, given the
+      session data.
+    - session_data (tuple): The validated data frame and the aggregate
+      cube, shared with the server.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_DFL)
+    connection, _ = listener.accept()
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    listener.close()
+    os.write(status_pipe, f"{os.getpid()}\n".encode())
+    os.close(status_pipe)
+
+    # Give the session its own terminal, the same size as the browser
+    # terminal, so input is echoed and edited as in a spawned process
+    master, terminal = os.openpty()
+    fcntl.ioctl(
+        terminal, termios.TIOCSWINSZ, struct.pack('HHHH', 24, 80, 0, 0)
+        )
+    finished = threading.Event()
+    output = relay_terminal(connection, master, finished)
+    for fd in (0, 1, 2):
+        os.dup2(terminal, fd)
+    os.close(terminal)
+    sys.stdin = open(0, 'r', closefd=False)
+    sys.stdout = open(1, 'w', buffering=1, closefd=False)
+    sys.stderr = open(2, 'w', buffering=1, closefd=False)
+
+    exit_code = 0
+    try:
+        run_session(*session_data)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 0
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        exit_code = 1
+    finally:
+        SHEET_WRITER.wait()
+        LOG_SINK.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        finished.set()
+        for fd in (0, 1, 2):
+            os.close(fd)
+        output.join(timeout=5)
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        connection.close()
+        os._exit(exit_code)
+
+
+def serve_sessions(
+        socket_path, pool_size, refresh_interval, load_data,
+        check_master_data, run_session
+        ):
+    """
+    Serves interactive sessions on a Unix socket from a pool of forked
+    workers, so the data is loaded and validated once rather than for
+    every session.
+
+    The server validates the data, then forks pool_size workers that wait
+    for connections. Each worker runs one session and exits, and a new
+    worker is forked as soon as one takes a connection. The workers are
+    copy-on-write forks of the server, so a session starts at once and
+    shares the memory of the validated data.
+
+    Every refresh_interval seconds the master data is checked, reading
+    only its new rows unless a full check is due. If its revision has
+    changed, the rows read are validated again and the waiting workers
+    are replaced, while sessions already running keep the data they
+    started with. A SIGHUP validates every row again straight away,
+    without the local snapshot, for when the validation rules have been
+    changed. Workers are only forked once the background writes of the
+    validation have finished.
+
+    Args:
+    - socket_path (str): The path of the Unix socket to listen on.
+    - pool_size (int): The number of workers kept waiting for a session.
+    - refresh_interval (int): Seconds between checks of the master data
+      revision, or 0 to never check.
+    - load_data (function): Validates the data, returning the validated
+      data frame and the aggregate cube, and the revision of the master
+      data they were built from. When validating again it is passed
+      clear_tabs=True, to clear the tabs the validation writes, and
+      either the master data already read by check_master_data or,
+      after a SIGHUP, use_snapshot=False.
+    - check_master_data (function): Returns the master data from
+      load_master_data, holding its rows and revision, or None if it
+      could not be read.
+    - run_session (function): Runs one interactive session, given the
+      validated data frame and the aggregate cube.
+    """
+    session_data, revision = load_data()
+    preload_modules()
+
+    # Finish the uploads of the validation before forking, so no worker
+    # is forked while the background writer is part way through a write
+    SHEET_WRITER.wait()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(16)
+    status_read, status_write = os.pipe()
+    waiting = set()
+    status = b''
+
+    # Exit cleanly when the dyno is stopped, and validate again on SIGHUP
+    reload_requested = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    signal.signal(
+        signal.SIGHUP, lambda signum, frame: reload_requested.set()
+        )
+
+    # Keep the loaded objects out of garbage collection, so the workers
+    # do not copy the pages that hold them
+    gc.freeze()
+
+    print(f"Serving sessions on {socket_path}\n")
+    last_check = time.monotonic()
+    try:
+        while True:
+            # Keep the pool of waiting workers full
+            while len(waiting) < pool_size:
+                pid = os.fork()
+                if pid == 0:
+                    os.close(status_read)
+                    run_session_worker(
+                        listener, status_write, run_session, session_data
+                        )
+                waiting.add(pid)
+
+            ready, _, _ = select.select([status_read], [], [], 1)
+            if ready:
+                status += os.read(status_read, 4096)
+                *taken, status = status.split(b'\n')
+                waiting.difference_update(int(pid) for pid in taken)
+
+            # Collect the workers whose sessions have ended
+            while True:
+                try:
+                    pid, _ = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if pid == 0:
+                    break
+                waiting.discard(pid)
+
+            reload = reload_requested.is_set()
+            if reload:
+                reload_requested.clear()
+            if reload or refresh_interval and (
+                    time.monotonic() - last_check >= refresh_interval):
+                last_check = time.monotonic()
+                master_data = None if reload else check_master_data()
+                changed = master_data is not None and (
+                    master_data['revision'] != revision)
+                if reload or changed:
+                    if reload:
+                        print("Validating every row again, as asked\n")
+                    else:
+                        print("The master data has changed, validating "
+                              "again\n")
+                    gc.unfreeze()
+                    session_data, revision = load_data(
+                        clear_tabs=True, use_snapshot=not reload,
+                        master_data=master_data
+                        )
+                    SHEET_WRITER.wait()
+                    for pid in waiting:
+                        os.kill(pid, signal.SIGTERM)
+                    waiting.clear()
+                    gc.freeze()
+    finally:
+        for pid in waiting:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def interrogate_data(
+        validated_df, aggregate_cube, gael_force_error_log_url, error_log,
+        user_data_output, user_data_output_url, storage,
+        graphical_output_data_url, graphical_output_sheet
+        ):
+    """
+    Runs the data interrogation part of a session, asking the user for
+    date ranges, data selections and outputs until they quit.
+
+    Args:
+    - validated_df (pd.DataFrame): The validated data, sorted on a
+      datetime index as returned by format_df_date.
+    - aggregate_cube (dict): The aggregate cube of the validated data.
+    - gael_force_error_log_url (str): URL of the error log worksheet.
+    - error_log (gspread.models.Worksheet): The worksheet for the error
+      log.
+    - user_data_output (gspread.models.Worksheet): The worksheet for the
+      user data output.
+    - user_data_output_url (str): URL of the user data output worksheet.
+    - storage (GoogleSheetsBackend or LocalBackend): The storage
+      backend the chart is written with.
+    - graphical_output_data_url (str): URL of the chart worksheet.
+    - graphical_output_sheet (gspread.models.Worksheet): The worksheet for
+      the chart data.
+    """
+    error_log_data = []
+    print("\n")
+    print("#########################################################")
+    print("    >>>>> Phase 2. Data Interrogation Starting      <<<<<")
+    print("#########################################################")
+    print("\n")
+    print("Please Check The Error Log Files For Any Errors Found")
+    print(
+        f"    \nSession Errors Can Be Found Here:"
+        f"\n\n{gael_force_error_log_url}\n\n"
+        )
+
+    # Outer Loop - get dates from user for specified range
+    while True:
+        # Report any upload of the validation that has failed, between
+        # prompts rather than in the middle of one
+        SHEET_WRITER.report()
+
+        # Get dates from user to interrogate validated data frame
+        user_input_start_date_str, user_input_end_date_str = (
+            get_user_dates(validated_df, error_log_data, error_log))
+
+        # Check if user selected "quit"
+        if (user_input_start_date_str is None or user_input_end_date_str
+                is None):
+            print("\n\nDate input was canceled. Exiting program.\n\n")
+            exit()  # Exit app
+
+        # Convert user input dates to the format used in validated_df
+        user_input_start_date = user_input_start_date_str
+        user_input_end_date = user_input_end_date_str
+        print(f"Date Range - Beginning: {user_input_start_date}")
+        print(f"Date Range - End: {user_input_end_date}")
+
+        # Filter the dataframe based on the date range
+        date_filtered_df = filter_data_by_date(
+            validated_df,
+            user_input_start_date,
+            user_input_end_date
             )
 
+        # Format the dataframe for display, converting date format
+        # to dd-mm-yyyy
+        working_data_df = format_df_data_for_display(date_filtered_df)
+        # Middle loop - getting specific data set for user output
+        while True:
+            # Get users selection for data output columns
+            selected_columns = get_data_selection(error_log)
+            if not selected_columns:
+                break
+            user_output_df = working_data_df[selected_columns]
+            num_rows = len(user_output_df)
+            print(f"\nThere are {num_rows} rows of data.     <<<<<\n")
+
+            # Summarise the selected data from the aggregate cube
+            print_date_range_summary(
+                aggregate_cube, user_input_start_date,
+                user_input_end_date, selected_columns
+                )
+
+            # Determine output options based on rows
+            allow_screen, allow_graph, allow_sheet = (
+                determine_output_options(num_rows))
+            # Create output based on user selection
+            with PROFILER.phase('output'):
+                get_output_selection(
+                    user_output_df, user_data_output, selected_columns,
+                    allow_screen, allow_graph, allow_sheet,
+                    num_rows, storage, user_data_output_url,
+                    error_log, graphical_output_data_url,
+                    graphical_output_sheet
+                    )
+
 
 def main():
     """
@@ -2124,6 +5227,10 @@ def main():
     - Updates the error log with details of any errors encountered during
       execution.
 
+    With --start and --end a single batch extract is written instead, and
+    with --serve the data is validated once and each session is run by
+    serve_sessions in a forked worker.
+
     Exit Conditions:
     - Exits if the data is not validated or if the user inputs invalid dates
       or choices.
@@ -2131,11 +5238,34 @@ def main():
     Returns:
     - None
     """
+    args = parse_args()
+
+    # Check the validation stages before anything is loaded
+    try:
+        check_validation_stages(VALIDATION_STAGE_ORDER)
+    except ValueError as e:
+        print(f"Error: GAELFORCE_VALIDATION_STAGES: {e}")
+        exit(2)
+    if args.import_report:
+        atexit.register(
+            print_import_report, time.perf_counter() - MODULE_LOAD_START,
+            time.process_time()
+            )
+    if args.profile or args.profile_stats is not None:
+        PROFILER.start(args.profile_stats)
+
+    # A batch extract keeps standard output for the extract itself, and
+    # prints its progress to standard error
+    extract_stream = sys.stdout
+    if args.start is not None:
+        sys.stdout = sys.stderr
+
     error_log_data = []
     # Initialise Sheets On Load
-    sheet_initialisation = initialise_google_sheets()
+    with PROFILER.phase('sheet_init'):
+        sheet_initialisation = initialise_storage()
     if sheet_initialisation:
-        (SHEET, SCOPED_CREDS, unvalidated_master_data, validated_master_data,
+        (storage, unvalidated_master_data, validated_master_data,
          user_data_output, session_log, error_log,
          date_time_error_log, graphical_output_sheet,
          atmos_outlier_log, wind_outlier_log, wave_outlier_log,
@@ -2144,22 +5274,36 @@ def main():
          gael_force_error_log_url, atmos_outliers_url, wind_outliers_url,
          wave_outliers_url, temp_outliers_url, date_time_url,
          graphical_output_data_url) = sheet_initialisation
-
-    while True:
-        # Introduce the app and ask user if they want to continue
-        decision = get_continue_yn(error_log)
-
-        # Initialise the sheets and validate the data
-        validated_df = data_initialisation_and_validation(
-            session_log_url, gael_force_error_log_url,
-            session_log, error_log, unvalidated_master_data,
-            date_time_error_log, atmos_outliers_url,
-            validated_master_data, validated_master_data_url,
-            wave_outlier_log, temp_outlier_log,
-            atmos_outlier_log, wind_outliers_url,
-            wave_outliers_url, temp_outliers_url,
-            wind_outlier_log, date_time_url
-            )
+        # Failed background writes are added to the error log
+        SHEET_WRITER.error_log = error_log
+
+    def load_validated_data(
+            clear_tabs=False, use_snapshot=True, master_data=None
+            ):
+        # The validation output tabs are only cleared when the sheets are
+        # opened, so a server validating again clears them first rather
+        # than adding to the logs of the last validation
+        if clear_tabs:
+            storage.clear_worksheets([
+                validated_master_data, session_log, error_log,
+                date_time_error_log, atmos_outlier_log, wind_outlier_log,
+                wave_outlier_log, temp_outlier_log
+                ])
+
+        # Validate the data, or restore it from the snapshot, and sort it
+        # on its datetime index
+        validated_df, aggregate_cube, revision = (
+            data_initialisation_and_validation(
+                storage, session_log_url, gael_force_error_log_url,
+                session_log, error_log, unvalidated_master_data,
+                date_time_error_log, atmos_outliers_url,
+                validated_master_data, validated_master_data_url,
+                wave_outlier_log, temp_outlier_log,
+                atmos_outlier_log, wind_outliers_url,
+                wave_outliers_url, temp_outliers_url,
+                wind_outlier_log, date_time_url, use_snapshot,
+                master_data
+                ))
 
         # Check to see if the data has been validated
         if validated_df is None:
@@ -2168,79 +5312,75 @@ def main():
                 "continue..... \nBye..."
                 )
             exit()
-        else:
-            print("\n")
-            print("#########################################################")
-            print("    >>>>> Phase 2. Data Interrogation Starting      <<<<<")
-            print("#########################################################")
-            print("\n")
-            print("Please Check The Error Log Files For Any Errors Found")
-            print(
-                f"    \nSession Errors Can Be Found Here:"
-                f"\n\n{gael_force_error_log_url}\n\n"
-                )
+
         # Convert the data frame date format to dd-mm-yyyy
-        format_df_date(validated_df)
+        return (format_df_date(validated_df), aggregate_cube), revision
 
-        # Outer Loop - get dates from user for specified range
-        while True:
-            # Get dates from user to interrogate validated data frame
-            user_input_start_date_str, user_input_end_date_str = (
-                get_user_dates(validated_df, error_log_data, error_log))
-
-            # Check if user selected "quit"
-            if (user_input_start_date_str is None or user_input_end_date_str
-                    is None):
-                print("\n\nDate input was canceled. Exiting program.\n\n")
-                exit()  # Exit app
-
-            # Convert user input dates to the format used in validated_df
-            user_input_start_date = user_input_start_date_str
-            user_input_end_date = user_input_end_date_str
-            print(f"Date Range - Beginning: {user_input_start_date}")
-            print(f"Date Range - End: {user_input_end_date}")
-
-            # Filter the dataframe based on the date range
-            date_filtered_df = filter_data_by_date(
-                validated_df,
-                user_input_start_date,
-                user_input_end_date
+    def check_master_data():
+        # Read the new rows of the master data, or all of it when a full
+        # check is due, to see if it has changed
+        return load_master_data(
+            unvalidated_master_data, load_master_data_snapshot()
+            )
+
+    def run_session(validated_df, aggregate_cube):
+        # Introduce the app, then let the user interrogate the data
+        get_continue_yn(error_log)
+        interrogate_data(
+            validated_df, aggregate_cube, gael_force_error_log_url,
+            error_log, user_data_output, user_data_output_url,
+            storage, graphical_output_data_url, graphical_output_sheet
+            )
+
+    # Validate the data once and serve sessions from forked workers
+    if args.serve:
+        serve_sessions(
+            args.serve, args.pool_size, args.refresh_interval,
+            load_validated_data,
+            check_master_data,
+            run_session
+            )
+        return
+
+    # Introduce the app and ask user if they want to continue, unless
+    # a batch extract was asked for on the command line
+    if args.start is None:
+        decision = get_continue_yn(error_log)
+
+    # Initialise the sheets and validate the data
+    (validated_df, aggregate_cube), _ = load_validated_data()
+
+    # Write the batch extract and exit, with no prompts
+    if args.start is not None:
+        with PROFILER.phase('output'):
+            extracted = run_batch_extract(
+                validated_df, args.start, args.end, args.columns,
+                args.output, args.output_file, error_log,
+                user_data_output, user_data_output_url, storage,
+                graphical_output_data_url, graphical_output_sheet,
+                extract_stream
                 )
+        SHEET_WRITER.wait()
+        exit(0 if extracted else 2)
 
-            # Format the dataframe for display, converting date format
-            # to dd-mm-yyyy
-            working_data_df = format_df_data_for_display(date_filtered_df)
-            # Middle loop - getting specific data set for user output
-            while True:
-                # Get users selection for data output columns
-                selected_columns = get_data_selection(error_log)
-                if not selected_columns:
-                    break
-                user_output_df = working_data_df[selected_columns]
-                num_rows = len(user_output_df)
-                print(f"\nThere are {num_rows} rows of data.     <<<<<\n")
-
-                # Determine output options based on rows
-                allow_screen, allow_graph, allow_sheet = (
-                    determine_output_options(num_rows))
-                # Create output based on user selection
-                get_output_selection(
-                    user_output_df, user_data_output, selected_columns,
-                    allow_screen, allow_graph, allow_sheet,
-                    num_rows, SCOPED_CREDS, user_data_output_url,
-                    error_log, graphical_output_data_url
-                    )
+    # The uploads of the validation run while the user picks their dates,
+    # and are finished before the app exits, however the user quits
+    try:
+        interrogate_data(
+            validated_df, aggregate_cube, gael_force_error_log_url,
+            error_log, user_data_output, user_data_output_url,
+            storage, graphical_output_data_url, graphical_output_sheet
+            )
+    finally:
+        SHEET_WRITER.wait()
 
     # Write error log to error log sheet if there are errors to be written
     if error_log_data:
         error_log_data = [[str(item) for item in sublist] for sublist in
                           error_log_data]
         print(f"The Error Log Contains:\n\n {error_log_data}")
-        handle_log_update(
-            error_log.update, error_log,
-            df_to_list_of_lists(pd.DataFrame(error_log_data)),
-            log_name='error log'
-            )
+        LOG_SINK.write(error_log, error_log_data, log_name='error log')
 
 
-main()
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Checks that validating the master data incrementally, from the
+validation state of an earlier session, gives the same validated data
+and logs as validating every row at once.
+"""
+import os
+import re
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchmark  # noqa: E402
+import run  # noqa: E402
+
+ROWS = 2000
+BOUNDARY = 1200
+
+
+def validate(master_data, validation_state=None, outlier_detectors=None):
+    """
+    Validates master data with every worksheet held in memory, and
+    returns the validated data and the validation logs.
+    """
+    worksheets = benchmark.new_worksheets(master_data)
+    validated_df, validation_logs = run.validate_master_data(
+        run.LocalBackend(), master_data, [], [],
+        worksheets['session_log'],
+        worksheets['gael_force_error_log'],
+        worksheets['date_time_error_log'],
+        worksheets['validated_master_data'], '',
+        worksheets['atmos_outliers'], '',
+        worksheets['wind_outliers'], '',
+        worksheets['wave_outliers'], '',
+        worksheets['temp_outliers'], '', '',
+        outlier_detectors, validation_state
+        )
+    run.SHEET_WRITER.wait()
+    return validated_df, validation_logs
+
+
+def clean_row(master_data, start):
+    """
+    Returns the position of the first row from start with every value
+    present and a well formed time.
+    """
+    time_column = master_data[0].index('time')
+    for position in range(start, len(master_data)):
+        row = master_data[position]
+        if all(row) and re.match(
+                r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$',
+                row[time_column]):
+            return position
+    raise AssertionError("No clean row in the generated data")
+
+
+def master_data_with_boundary_duplicate():
+    """
+    Generates master data where a row after the boundary repeats a row
+    before it, so the duplicate spans the two validation batches.
+    """
+    master_data = benchmark.generate_master_data(ROWS, seed=7)
+    original = clean_row(master_data, 100)
+    master_data[BOUNDARY + 100] = list(master_data[original])
+    return master_data
+
+
+def assert_same_validation(incremental, full):
+    validated_df, validation_logs = incremental
+    full_df, full_logs = full
+    pd.testing.assert_frame_equal(validated_df, full_df)
+    assert validation_logs['error_log'] == full_logs['error_log']
+    assert validation_logs['date_time_error_log'] == (
+        full_logs['date_time_error_log']
+        )
+    assert validation_logs['outliers'].keys() == full_logs['outliers'].keys()
+    for group, outliers in full_logs['outliers'].items():
+        pd.testing.assert_frame_equal(
+            validation_logs['outliers'][group], outliers
+            )
+
+
+def test_appended_rows_match_full_validation():
+    master_data = master_data_with_boundary_duplicate()
+    full = validate(master_data)
+
+    validation_state = run.new_validation_state()
+    outlier_detectors = {}
+    validate(master_data[:BOUNDARY + 1], validation_state, outlier_detectors)
+    incremental = validate(master_data, validation_state, outlier_detectors)
+
+    assert_same_validation(incremental, full)
+    assert ['Duplicate Rows Found'] in full[1]['error_log']
+    assert ['Missing Values       <<<<<'] in full[1]['error_log']
+
+
+def test_edited_rows_match_full_validation():
+    master_data = master_data_with_boundary_duplicate()
+    validation_state = run.new_validation_state()
+    validate(master_data, validation_state)
+
+    # Edit a row before the boundary, then validate from the first edit
+    edited = [list(row) for row in master_data]
+    pressure = edited[0].index('AtmosphericPressure')
+    edited[BOUNDARY - 200][pressure] = ''
+    validation_state = run.rewind_validation_state(validation_state, edited)
+    assert len(validation_state['outcomes']) == BOUNDARY - 201
+
+    assert_same_validation(
+        validate(edited, validation_state), validate(edited)
+        )
@@ -0,0 +1,70 @@
+"""
+Checks that a session with a snapshot reads only the rows appended to
+the master data worksheet, and that a full check finds edited rows.
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchmark  # noqa: E402
+import run  # noqa: E402
+
+ROWS = 500
+APPENDED = 20
+
+
+def snapshot_of(master_data, tmp_path, monkeypatch):
+    """
+    Saves a snapshot of master_data in tmp_path, and returns it as the
+    next session loads it.
+    """
+    monkeypatch.setattr(run, 'SNAPSHOT_DIR', str(tmp_path))
+    monkeypatch.setattr(
+        run, 'SNAPSHOT_FILE', str(tmp_path / 'master_data_snapshot.pkl')
+        )
+    run.save_master_data_snapshot(
+        run.get_master_data_revision(master_data), master_data,
+        pd.DataFrame({'time': ['2024-01-01']}), {}, {}
+        )
+    return run.load_master_data_snapshot()
+
+
+def test_appended_rows_are_read_from_the_tail(tmp_path, monkeypatch):
+    master_data = benchmark.generate_master_data(ROWS + APPENDED, seed=3)
+    worksheet = benchmark.MemoryWorksheet(
+        'marine_data_master_data_2020_2024', 0, master_data[:ROWS + 1]
+        )
+    snapshot = snapshot_of(worksheet.rows, tmp_path, monkeypatch)
+    worksheet.rows = master_data
+
+    def get_all_values():
+        raise AssertionError("The whole worksheet was read")
+
+    worksheet.get_all_values = get_all_values
+    loaded = run.load_master_data(worksheet, snapshot)
+
+    assert loaded['rows'] == master_data
+    assert loaded['new_row_count'] == APPENDED
+    assert loaded['revision'] == run.get_master_data_revision(master_data)
+
+
+def test_full_check_finds_edited_rows(tmp_path, monkeypatch):
+    master_data = benchmark.generate_master_data(ROWS, seed=3)
+    worksheet = benchmark.MemoryWorksheet(
+        'marine_data_master_data_2020_2024', 0, master_data
+        )
+    snapshot = snapshot_of(master_data, tmp_path, monkeypatch)
+    edited = [list(row) for row in master_data]
+    edited[50][edited[0].index('AtmosphericPressure')] = '1001.0'
+    worksheet.rows = edited
+
+    # Edits above the last row are not seen until a full check is due
+    assert run.load_master_data(worksheet, snapshot)['new_row_count'] == 0
+
+    monkeypatch.setattr(run, 'FULL_CHECK_HOURS', 0)
+    loaded = run.load_master_data(worksheet, snapshot)
+    assert loaded['rows'] == edited
+    assert loaded['new_row_count'] is None